@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""Synthetic-fleet benchmark for wt.
+
+Builds N projects with M managed worktrees each against local bare remotes,
+then times the main operations and counts the subprocesses each one starts.
+Results can be saved as a baseline and later runs compared against it, so a
+change that multiplies git spawns shows up before it reaches anyone's shell.
+
+    python3 wt/tests/bench_wt.py --projects 12 --worktrees 5 --save baseline.json
+    python3 wt/tests/bench_wt.py --projects 12 --worktrees 5 --compare baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Generator, TextIO
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from wt import AsyncRunner, CommandTrace, Runner, WorktreeManager
+
+# Wall time is noisy, so only a large, non-trivial slowdown is a regression.
+WALL_TIME_TOLERANCE = 1.5
+WALL_TIME_FLOOR = 0.05
+
+
+@dataclass(frozen=True)
+class FleetShape:
+    projects: int = 3
+    worktrees: int = 3
+    files: int = 50
+    ignored_files: int = 200
+
+
+class NullTools:
+    """Session integrations that do nothing, so only git is measured."""
+
+    def pick(self, choices: list[str], prompt: str) -> str:
+        return choices[0]
+
+    def pick_stream(
+        self, choices: Generator[str, None, None], prompt: str, *, empty: str | None = None
+    ) -> str:
+        with contextlib.closing(choices):
+            return next(choices)
+
+    def zoxide_add(self, path: Path) -> None:
+        pass
+
+    def zoxide_add_all(self, paths: list[Path]) -> None:
+        pass
+
+    def zoxide_remove_all(self, paths: list[Path]) -> None:
+        pass
+
+    def refill_pool(self, project: Path) -> None:
+        pass
+
+    def sesh_connect(self, path: Path) -> None:
+        pass
+
+    def kill_tmux_sessions(self, paths: list[Path]) -> None:
+        pass
+
+
+def git(*arguments: str, cwd: Path | None = None) -> None:
+    subprocess.run(["git", *arguments], cwd=cwd, check=True, capture_output=True, text=True)
+
+
+def build_fleet(base: Path, shape: FleetShape) -> tuple[Path, Path, list[Path]]:
+    """Create remotes, primary checkouts and managed worktrees under base."""
+    projects_dir = base / "projects"
+    root = base / "managed"
+    projects_dir.mkdir()
+    root.mkdir()
+    projects: list[Path] = []
+    for number in range(shape.projects):
+        name = f"project{number:03d}"
+        remote = base / "remotes" / f"{name}.git"
+        seed = base / "seeds" / name
+        project = projects_dir / name
+        git("init", "--bare", "-b", "main", str(remote))
+        git("init", "-b", "main", str(seed))
+        for index in range(shape.files):
+            path = seed / "src" / f"module{index // 100:03d}" / f"file{index:05d}.txt"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(f"{name} {index}\n")
+        (seed / ".gitignore").write_text("node_modules/\n")
+        git("add", ".", cwd=seed)
+        git(
+            "-c",
+            "user.name=bench",
+            "-c",
+            "user.email=bench@example.invalid",
+            "commit",
+            "-qm",
+            "initial",
+            cwd=seed,
+        )
+        git("remote", "add", "origin", str(remote), cwd=seed)
+        git("push", "-q", "origin", "main", cwd=seed)
+        git("clone", "-q", str(remote), str(project))
+        for worktree_number in range(shape.worktrees):
+            destination = root / f"{name}-topic{worktree_number}"
+            git(
+                "worktree",
+                "add",
+                "-q",
+                "-b",
+                f"user/topic{worktree_number}",
+                str(destination),
+                "origin/main",
+                cwd=project,
+            )
+            for index in range(shape.ignored_files):
+                path = destination / "node_modules" / f"pkg{index // 50:03d}" / f"{index}.js"
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text("module.exports = {};\n")
+        projects.append(project.resolve())
+    return projects_dir, root, projects
+
+
+def measure(
+    name: str,
+    make_manager: Callable[[Runner, AsyncRunner], WorktreeManager],
+    operation: Callable[[WorktreeManager], object],
+) -> dict[str, object]:
+    trace = CommandTrace()
+    manager = make_manager(Runner(trace), AsyncRunner(trace=trace))
+    started = time.perf_counter()
+    operation(manager)
+    elapsed = time.perf_counter() - started
+    return {
+        "operation": name,
+        "seconds": round(elapsed, 4),
+        "subprocesses": len(trace.records),
+        "by_command": {label: count for label, count, *_ in trace.summary()},
+    }
+
+
+def run_benchmark(shape: FleetShape, *, jobs: int = 8) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory(prefix="wt-bench-") as temporary:
+        base = Path(temporary)
+        projects_dir, root, projects = build_fleet(base, shape)
+
+        def make_manager(runner: Runner, async_runner: AsyncRunner) -> WorktreeManager:
+            return WorktreeManager(
+                root=root,
+                cwd=projects_dir,
+                runner=runner,
+                async_runner=async_runner,
+                tools=NullTools(),  # type: ignore[arg-type]
+                stdout=io.StringIO(),
+                input_fn=lambda prompt: "y",
+                jobs=jobs,
+            )
+
+        first, last = projects[0], projects[-1]
+        results = [
+            measure("list (cold index)", make_manager, lambda manager: manager.list(None)),
+            measure("list", make_manager, lambda manager: manager.list(None)),
+            measure("resolve", make_manager, lambda manager: manager.resolve_project(last.name)),
+            measure(
+                "new",
+                make_manager,
+                lambda manager: manager.new(str(first), "user/bench-new", "main"),
+            ),
+            measure(
+                "delete",
+                make_manager,
+                lambda manager: manager.delete(str(first), "user/bench-new", force=False),
+            ),
+            measure(
+                "clean",
+                make_manager,
+                lambda manager: manager.clean(str(last), force=True, yes=True),
+            ),
+        ]
+    return {"shape": shape.__dict__, "jobs": jobs, "results": results}
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any]) -> list[str]:
+    """Describe every operation that spawns more processes or is much slower."""
+    if current.get("shape") != baseline.get("shape"):
+        return ["fleet shape differs from the baseline; rerun with the same options"]
+    previous = {str(result["operation"]): result for result in baseline.get("results", [])}
+    problems: list[str] = []
+    for result in current["results"]:
+        before = previous.get(str(result["operation"]))
+        if before is None:
+            continue
+        if result["subprocesses"] > before["subprocesses"]:
+            problems.append(
+                f"{result['operation']}: {before['subprocesses']} -> "
+                f"{result['subprocesses']} subprocesses"
+            )
+        slower = result["seconds"] - before["seconds"]
+        if (
+            result["seconds"] > before["seconds"] * WALL_TIME_TOLERANCE
+            and slower > WALL_TIME_FLOOR
+        ):
+            problems.append(
+                f"{result['operation']}: {before['seconds']:.3f}s -> {result['seconds']:.3f}s"
+            )
+    return problems
+
+
+def print_report(report: dict[str, Any], output: TextIO = sys.stdout) -> None:
+    results: list[dict[str, Any]] = report["results"]
+    width = max(len("OPERATION"), *(len(str(item["operation"])) for item in results))
+    print(f"{'OPERATION':<{width}}  {'SECONDS':>8}  {'PROCS':>5}  TOP COMMANDS", file=output)
+    for item in results:
+        commands = list(item["by_command"].items())[:3]
+        top = ", ".join(f"{label} x{count}" for label, count in commands)
+        print(
+            f"{item['operation']:<{width}}  {item['seconds']:>8.3f}  "
+            f"{item['subprocesses']:>5}  {top}",
+            file=output,
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark wt against a synthetic fleet")
+    parser.add_argument("--projects", type=int, default=FleetShape.projects)
+    parser.add_argument("--worktrees", type=int, default=FleetShape.worktrees)
+    parser.add_argument("--files", type=int, default=FleetShape.files)
+    parser.add_argument("--ignored-files", type=int, default=FleetShape.ignored_files)
+    parser.add_argument("--jobs", type=int, default=8)
+    parser.add_argument("--save", type=Path, help="write the results as a baseline JSON file")
+    parser.add_argument("--compare", type=Path, help="fail if worse than this baseline")
+    args = parser.parse_args(argv)
+    if args.projects < 1 or args.worktrees < 1:
+        parser.error("--projects and --worktrees must be at least 1")
+
+    shape = FleetShape(args.projects, args.worktrees, args.files, args.ignored_files)
+    report = run_benchmark(shape, jobs=args.jobs)
+    print_report(report)
+    if args.save:
+        args.save.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    if args.compare:
+        problems = compare(report, json.loads(args.compare.read_text(encoding="utf-8")))
+        for problem in problems:
+            print(f"regression: {problem}", file=sys.stderr)
+        return 1 if problems else 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
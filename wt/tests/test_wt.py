@@ -1,16 +1,44 @@
 from __future__ import annotations
 
+import argparse
+import asyncio
+import errno
 import io
+import json
+import os
+import shutil
 import subprocess
 import sys
 import tempfile
+import threading
+import time
 import unittest
 from pathlib import Path
-from unittest.mock import Mock
+from typing import Callable, Generator
+from unittest.mock import Mock, patch
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-from wt import ExternalTools, Runner, WTError, WorktreeManager
+from wt import (
+    DEFAULT_BRANCH_TTL,
+    DIRTY_MODES,
+    AsyncRunner,
+    CommandTrace,
+    Daemon,
+    DiskUsage,
+    DaemonClient,
+    ExternalTools,
+    Runner,
+    Seeder,
+    WTError,
+    Worktree,
+    WorktreeManager,
+    build_parser,
+    linked_gitdir,
+)
+
+import bench_wt
+import wt_complete
 
 
 def run(*command: str, cwd: Path | None = None) -> subprocess.CompletedProcess[str]:
@@ -19,12 +47,27 @@ def run(*command: str, cwd: Path | None = None) -> subprocess.CompletedProcess[s
     )
 
 
+class CountingRunner(Runner):
+    def __init__(self) -> None:
+        super().__init__()
+        self.commands: list[list[str]] = []
+
+    def run(self, command: list[str], **kwargs: object) -> subprocess.CompletedProcess[str]:
+        self.commands.append(command)
+        return super().run(command, **kwargs)  # type: ignore[arg-type]
+
+    def first_line(self, command: list[str], **kwargs: object) -> tuple[str, int | None]:
+        self.commands.append(command)
+        return super().first_line(command, **kwargs)  # type: ignore[arg-type]
+
+
 class FakeTools:
     def __init__(self) -> None:
         self.added: list[Path] = []
         self.removed: list[Path] = []
         self.killed: list[Path] = []
         self.connected: list[Path] = []
+        self.refilled: list[Path] = []
         self.selections: list[str] = []
 
     def pick(self, choices: list[str], prompt: str) -> str:
@@ -36,17 +79,36 @@ class FakeTools:
             raise AssertionError(f"{wanted!r} not in {choices!r}")
         return choices[0]
 
+    def pick_stream(
+        self,
+        choices: Generator[str, None, None],
+        prompt: str,
+        *,
+        empty: str | None = None,
+        stop: Callable[[], object] | None = None,
+    ) -> str:
+        offered = list(choices)
+        if not offered:
+            raise WTError(empty or f"no {prompt.lower()} available")
+        return self.pick(offered, prompt)
+
     def zoxide_add(self, path: Path) -> None:
         self.added.append(path)
 
-    def zoxide_remove(self, path: Path) -> None:
-        self.removed.append(path)
+    def zoxide_add_all(self, paths: list[Path]) -> None:
+        self.added.extend(paths)
+
+    def zoxide_remove_all(self, paths: list[Path]) -> None:
+        self.removed.extend(paths)
+
+    def refill_pool(self, project: Path) -> None:
+        self.refilled.append(project)
 
     def sesh_connect(self, path: Path) -> None:
         self.connected.append(path)
 
-    def kill_tmux_at(self, path: Path) -> None:
-        self.killed.append(path)
+    def kill_tmux_sessions(self, paths: list[Path]) -> None:
+        self.killed.extend(paths)
 
 
 class WorktreeTests(unittest.TestCase):
@@ -118,8 +180,32 @@ class WorktreeTests(unittest.TestCase):
         run("git", "push", "origin", "master", cwd=self.seed)
         run("git", "symbolic-ref", "HEAD", "refs/heads/master", cwd=self.remote)
 
-        destination = self.manager.new(str(self.project), "user/from-master", None)
+        destination = self.manager.new(
+            str(self.project), "user/from-master", None, refresh_default=True
+        )
         self.assertTrue((destination / "MASTER").is_file())
+        self.assertEqual(self.manager.local_default_branch(self.project), "master")
+
+    def test_default_branch_prefers_origin_head_then_cache(self) -> None:
+        runner = CountingRunner()
+        manager = WorktreeManager(
+            root=self.root,
+            cwd=self.projects,
+            runner=runner,
+            tools=self.tools,  # type: ignore[arg-type]
+        )
+        self.assertEqual(manager.default_base_branch(self.project), "main")
+        self.assertEqual(runner.commands, [])
+
+        run("git", "remote", "set-head", "origin", "--delete", cwd=self.project)
+        self.assertEqual(manager.default_base_branch(self.project), "main")
+        self.assertEqual(len(runner.commands), 1)
+        runner.commands.clear()
+        manager.new(str(self.project), "user/cached", None)
+        self.assertFalse(any("--symref" in command for command in runner.commands))
+
+        manager.default_branches.clock = lambda: time.time() + DEFAULT_BRANCH_TTL
+        self.assertIsNone(manager.known_default_branch(self.project))
 
     def test_new_uses_alternate_origin_base(self) -> None:
         run("git", "checkout", "-b", "develop", cwd=self.seed)
@@ -146,6 +232,202 @@ class WorktreeTests(unittest.TestCase):
         with self.assertRaisesRegex(WTError, "destination already exists"):
             self.manager.new(str(self.project), "user/collision", "main")
 
+    def test_new_asks_origin_for_default_and_branch_in_one_query(self) -> None:
+        run("git", "checkout", "-b", "user/taken", cwd=self.seed)
+        run("git", "push", "origin", "user/taken", cwd=self.seed)
+        runner = CountingRunner()
+        manager = WorktreeManager(
+            root=self.root,
+            cwd=self.projects,
+            runner=runner,
+            tools=self.tools,  # type: ignore[arg-type]
+        )
+        with self.assertRaisesRegex(WTError, "already exists on origin"):
+            manager.new(str(self.project), "user/taken", None)
+
+        runner.commands.clear()
+        manager.new(str(self.project), "user/fresh", None)
+        remote_calls = [
+            command[3] for command in runner.commands if command[3] in {"ls-remote", "fetch"}
+        ]
+        # main was fetched by the first attempt, so only origin is asked again.
+        self.assertEqual(remote_calls, ["ls-remote"])
+
+    def test_new_skips_recent_fetches_unless_forced_or_base_is_missing(self) -> None:
+        runner = CountingRunner()
+
+        def manager(ttl: float = 60) -> WorktreeManager:
+            return WorktreeManager(
+                root=self.root,
+                cwd=self.projects,
+                runner=runner,
+                tools=self.tools,  # type: ignore[arg-type]
+                fetch_ttl=ttl,
+            )
+
+        def fetches() -> int:
+            count = sum("fetch" in command for command in runner.commands)
+            runner.commands.clear()
+            return count
+
+        manager().new(str(self.project), "user/one", "main")
+        self.assertEqual(fetches(), 1)
+        manager().new(str(self.project), "user/two", "main")
+        self.assertEqual(fetches(), 0)
+        manager().new(str(self.project), "user/three", "main", fetch=True)
+        self.assertEqual(fetches(), 1)
+        manager(ttl=0).new(str(self.project), "user/four", "main")
+        self.assertEqual(fetches(), 1)
+
+        run("git", "push", "origin", "main:release", cwd=self.seed)
+        manager().new(str(self.project), "user/five", "release", fetch=False)
+        self.assertEqual(fetches(), 1)
+        manager().new(str(self.project), "user/six", "release", fetch=False)
+        self.assertEqual(fetches(), 0)
+
+    def test_new_many_checks_everything_first_then_creates_concurrently(self) -> None:
+        runner = CountingRunner()
+        manager = WorktreeManager(
+            root=self.root,
+            cwd=self.projects,
+            runner=runner,
+            tools=self.tools,  # type: ignore[arg-type]
+            stdout=self.output,
+            jobs=3,
+        )
+        branches = ["user/t-1", "user/t-2", "user/t-3"]
+        created = manager.new_many(str(self.project), branches, None)
+
+        self.assertEqual(created, [self.root / f"demo-t-{number}" for number in (1, 2, 3)])
+        self.assertTrue(all(path.is_dir() for path in created))
+        self.assertEqual(self.tools.connected, [])
+        self.assertEqual(self.tools.added, created)
+        self.assertEqual(self.output.getvalue().split(), [str(path) for path in created])
+        subcommands = [command[3] for command in runner.commands if command[0] == "git"]
+        self.assertEqual(subcommands.count("ls-remote"), 1)
+        self.assertEqual(subcommands.count("fetch"), 1)
+        self.assertEqual(subcommands.count("worktree"), 3)
+
+        for branches, message in (
+            (["user/ok", "user/t-1"], "local branch already exists: user/t-1"),
+            (["user/ok", "bad..name"], "invalid branch name"),
+            (["user/x", "other/x"], "would share a worktree"),
+            (["user/ok", "user/ok"], "more than once"),
+        ):
+            with self.assertRaisesRegex(WTError, message):
+                manager.new_many(str(self.project), branches, "main")
+        self.assertFalse((self.root / "demo-ok").exists())
+
+    def test_new_sparse_checks_out_only_cone_paths_or_a_named_profile(self) -> None:
+        for directory in ("apps/web", "apps/api", "libs/ui"):
+            (self.seed / directory).mkdir(parents=True)
+            (self.seed / directory / "file").write_text(directory)
+        run("git", "add", ".", cwd=self.seed)
+        run("git", "commit", "-m", "monorepo", cwd=self.seed)
+        run("git", "push", "origin", "main", cwd=self.seed)
+
+        web = self.manager.new(str(self.project), "user/web", "main", sparse=["apps/web"])
+        self.assertTrue((web / "apps/web/file").exists())
+        self.assertTrue((web / "README").exists())
+        self.assertFalse((web / "apps/api").exists())
+        self.assertFalse((web / "libs").exists())
+        self.assertEqual(run("git", "status", "--porcelain", cwd=web).stdout, "")
+        self.assertEqual(
+            run("git", "config", "extensions.worktreeConfig", cwd=self.project).stdout, "true\n"
+        )
+
+        run("git", "config", "--add", "wt-sparse.frontend.path", "apps/web", cwd=self.project)
+        run("git", "config", "--add", "wt-sparse.frontend.path", "libs/ui", cwd=self.project)
+        [ui] = self.manager.new_many(
+            str(self.project), ["user/ui"], "main", sparse_profile="frontend"
+        )
+        self.assertTrue((ui / "libs/ui/file").exists())
+        self.assertTrue((ui / "apps/web/file").exists())
+        self.assertFalse((ui / "apps/api").exists())
+        with self.assertRaisesRegex(WTError, "unknown sparse profile: missing"):
+            self.manager.new(str(self.project), "user/x", "main", sparse_profile="missing")
+
+        full = self.new("user/full")
+        self.assertTrue((full / "apps/api/file").exists())
+
+    def test_new_seeds_ignored_directories_and_falls_back_to_copies(self) -> None:
+        (self.project / ".git/info/exclude").write_text("node_modules/\ntarget/\n")
+        modules = self.project / "node_modules"
+        (modules / "pkg/lib").mkdir(parents=True)
+        (modules / "pkg/index.js").write_text("module.exports = 1\n")
+        (modules / "pkg/lib/util.js").write_text("util\n")
+        (modules / ".bin").mkdir()
+        (modules / ".bin/pkg").symlink_to("../pkg/index.js")
+        (self.project / "target").mkdir()
+        (self.project / "target/out").write_text("built\n")
+        run("git", "config", "--add", "wt.seed", "node_modules", cwd=self.project)
+
+        seeded = self.manager.new(str(self.project), "user/seeded", "main", seed=["target"])
+        self.assertEqual((seeded / "node_modules/pkg/lib/util.js").read_text(), "util\n")
+        self.assertEqual(
+            (seeded / "node_modules/.bin/pkg").readlink(), Path("../pkg/index.js")
+        )
+        self.assertEqual((seeded / "target/out").read_text(), "built\n")
+        self.assertEqual(run("git", "status", "--porcelain", cwd=seeded).stdout, "")
+
+        bare = self.manager.new(str(self.project), "user/bare", "main", seed_config=False)
+        self.assertFalse((bare / "node_modules").exists())
+
+        unsupported = OSError(errno.EXDEV, "cross-device")
+        with patch.object(Seeder, "reflink", side_effect=unsupported), patch(
+            "os.link", side_effect=unsupported
+        ):
+            seeder = self.manager.seed_worktree(self.project, bare, ["node_modules"])
+        self.assertEqual(seeder.counts, {"reflink": 0, "hardlink": 0, "copy": 2})
+        copied = bare / "node_modules/pkg/index.js"
+        self.assertFalse(copied.samefile(modules / "pkg/index.js"))
+        again = self.manager.seed_worktree(self.project, bare, ["node_modules"])
+        self.assertEqual(sum(again.counts.values()), 0)
+        with self.assertRaisesRegex(WTError, "outside the project"):
+            self.manager.seed_worktree(self.project, bare, ["../elsewhere"])
+
+    def test_pool_slots_are_hidden_and_claimed_by_new(self) -> None:
+        project = self.project.resolve()
+        slots = self.manager.pool(str(self.project), size=2)
+        self.assertEqual(len(slots), 2)
+        self.assertTrue(all((slot / "README").exists() for slot in slots))
+        self.assertEqual(self.manager.list(None), [])
+        self.assertEqual(self.manager.managed_projects(), [])
+
+        (self.seed / "README").write_text("updated\n")
+        run("git", "commit", "-am", "update", cwd=self.seed)
+        run("git", "push", "origin", "main", cwd=self.seed)
+        destination = self.new("user/pooled")
+        self.assertEqual(destination, self.root / "demo-pooled")
+        self.assertEqual((destination / "README").read_text(), "updated\n")
+        self.assertEqual(
+            run("git", "branch", "--show-current", cwd=destination).stdout.strip(),
+            "user/pooled",
+        )
+        self.assertEqual(self.tools.refilled, [project])
+        self.assertEqual(len(list(self.manager.pool_dir(project).glob("*.ready"))), 1)
+        self.assertEqual([row[1].branch for row in self.manager.list(None)], ["user/pooled"])
+
+        self.assertEqual(len(self.manager.fill_pool(project)), 2)
+        with patch.object(WorktreeManager, "claim_pooled", return_value=None):
+            self.new("user/unpooled")
+        self.assertEqual(self.tools.refilled, [project])
+        self.manager.clean(str(self.project), force=False, yes=True)
+        self.assertEqual(len(self.manager.fill_pool(project)), 2)
+
+        # A claimed slot belongs to a `new` waiting for the worktree lock.
+        claimed = sorted(self.manager.pool_dir(project).glob("*.ready"))[0].with_suffix("")
+        self.assertTrue(self.manager.claim_slot(claimed))
+        self.assertNotIn(claimed, self.manager.fill_pool(project))
+        self.assertTrue((claimed / "README").exists())
+        self.assertIn(str(claimed), run("git", "worktree", "list", cwd=self.project).stdout)
+        claimed.with_suffix(".claimed").rename(claimed.with_suffix(".ready"))
+        self.assertEqual(len(self.manager.fill_pool(project)), 2)
+        self.assertEqual(self.manager.pool(str(self.project), size=0), [])
+        self.assertEqual(list(self.manager.pool_dir(project).iterdir()), [])
+        with self.assertRaisesRegex(WTError, "pool size"):
+            self.manager.pool(str(self.project), size=100)
+
     def test_new_interactive_discovers_direct_child_and_prompts_branch(self) -> None:
         manager = WorktreeManager(
             root=self.root,
@@ -156,6 +438,45 @@ class WorktreeTests(unittest.TestCase):
         destination = manager.new(None, None, "main")
         self.assertEqual(destination, self.root / "demo-prompted")
 
+    def test_discovery_only_runs_git_for_children_with_dot_git(self) -> None:
+        for number in range(5):
+            (self.projects / f"plain{number}").mkdir()
+        (self.projects / "notes.txt").write_text("not a directory")
+        gitfile = self.projects / "broken"
+        gitfile.mkdir()
+        (gitfile / ".git").write_text("gitdir: /nonexistent\n")
+
+        runner = CountingRunner()
+        manager = WorktreeManager(
+            root=self.root,
+            cwd=self.projects,
+            runner=runner,
+            tools=self.tools,  # type: ignore[arg-type]
+        )
+        self.assertEqual(manager.discover_projects(), [self.project.resolve()])
+        probed = {Path(command[2]).name for command in runner.commands}
+        self.assertEqual(probed, {"projects", "broken"})
+
+    def test_deep_discovery_prunes_repositories_and_ignored_directories(self) -> None:
+        nested = self.projects / "org" / "team" / "service"
+        nested.parent.mkdir(parents=True)
+        run("git", "clone", str(self.remote), str(nested))
+        (nested / "inner").mkdir()
+        run("git", "init", str(nested / "inner" / "vendored"))
+        hidden = self.projects / "node_modules" / "pkg"
+        hidden.parent.mkdir()
+        run("git", "init", str(hidden))
+
+        def discover(depth: int) -> list[str]:
+            manager = WorktreeManager(root=self.root, cwd=self.projects, discovery_depth=depth)
+            return [project.name for project in manager.discover_projects()]
+
+        self.assertEqual(discover(1), ["demo"])
+        self.assertEqual(discover(3), ["demo", "service"])
+        self.assertEqual(discover(6), ["demo", "service"])
+        manager = WorktreeManager(root=self.root, cwd=self.projects, discovery_depth=3)
+        self.assertEqual(manager.resolve_project("service"), nested.resolve())
+
     def test_delete_requires_exact_branch_refuses_dirty_and_preserves_branch(self) -> None:
         destination = self.new("user/topic")
         (destination / "dirty.txt").write_text("dirty")
@@ -185,6 +506,24 @@ class WorktreeTests(unittest.TestCase):
         self.manager.delete(str(self.project), "user/ignored", force=True)
         self.assertFalse(destination.exists())
 
+    def test_dirty_check_modes_trade_strictness_for_speed(self) -> None:
+        destination = self.new("user/modes")
+        worktree = self.manager.managed_for(self.project)[0]
+
+        def dirty(mode: str) -> bool:
+            return WorktreeManager(root=self.root, dirty_mode=mode).is_dirty(worktree)
+
+        (destination / "ignored.tmp").write_text("artifact")
+        self.assertEqual([dirty(mode) for mode in DIRTY_MODES], [False, False, True])
+        (destination / "notes.txt").write_text("untracked")
+        self.assertEqual([dirty(mode) for mode in DIRTY_MODES], [False, True, True])
+        (destination / "README").write_text("changed\n")
+        self.assertEqual([dirty(mode) for mode in DIRTY_MODES], [True, True, True])
+        admin = run("git", "rev-parse", "--git-dir", cwd=destination).stdout.strip()
+        self.assertFalse((destination / admin / "index.lock").exists())
+        with self.assertRaisesRegex(WTError, "unknown dirty check mode"):
+            WorktreeManager(root=self.root, dirty_mode="everything")
+
     def test_delete_project_only_uses_worktree_picker(self) -> None:
         first = self.new("user/first")
         second = self.new("user/second")
@@ -213,6 +552,151 @@ class WorktreeTests(unittest.TestCase):
         self.assertIn("user/first", branches)
         self.assertIn("user/second", branches)
 
+    def test_clean_removes_as_one_batch_with_a_single_prune(self) -> None:
+        worktrees = [self.new(f"user/batch{number}") for number in range(3)]
+        runner = CountingRunner()
+        manager = WorktreeManager(
+            root=self.root,
+            cwd=self.projects,
+            runner=runner,
+            tools=self.tools,  # type: ignore[arg-type]
+        )
+        manager.clean(str(self.project), force=False, yes=True)
+
+        self.assertFalse(any(path.exists() for path in worktrees))
+        subcommands = [command[3:5] for command in runner.commands if command[0] == "git"]
+        self.assertEqual(subcommands.count(["worktree", "prune"]), 1)
+        self.assertEqual(subcommands.count(["worktree", "remove"]), 3)
+        self.assertEqual(sorted(self.tools.killed), sorted(worktrees))
+
+    def test_gc_reports_then_batch_removes_clean_merged_gone_and_idle_worktrees(self) -> None:
+        fresh = self.new("user/fresh")
+        merged = self.new("user/merged")
+        (merged / "merged").write_text("merged\n")
+        run("git", "add", "merged", cwd=merged)
+        run("git", "commit", "-m", "merged", cwd=merged)
+        run("git", "push", "origin", "HEAD:main", cwd=merged)
+        run("git", "pull", "--ff-only", "origin", "main", cwd=self.seed)
+        (self.seed / "README").write_text("moved on\n")
+        run("git", "commit", "-am", "moved on", cwd=self.seed)
+        run("git", "push", "origin", "main", cwd=self.seed)
+        gone = self.new("user/gone")
+        (gone / "gone").write_text("gone\n")
+        run("git", "add", "gone", cwd=gone)
+        run("git", "commit", "-m", "gone", cwd=gone)
+        run("git", "push", "-u", "origin", "user/gone", cwd=gone)
+        run("git", "push", str(self.remote), "--delete", "user/gone", cwd=self.seed)
+        active = self.new("user/active")
+        (active / "active").write_text("active\n")
+        run("git", "add", "active", cwd=active)
+        run("git", "commit", "-m", "active", cwd=active)
+        dirty = self.new("user/dirty")
+        (dirty / "scratch").write_text("scratch\n")
+        admin = linked_gitdir(dirty)
+        assert admin is not None
+        old = time.time() - 90 * 86400
+        for name in ("HEAD", "index", "logs/HEAD"):
+            os.utime(admin / name, (old, old))
+
+        runner = CountingRunner()
+        manager = WorktreeManager(
+            root=self.root,
+            cwd=self.projects,
+            runner=runner,
+            tools=self.tools,  # type: ignore[arg-type]
+            input_fn=lambda prompt: "n",
+            stdout=io.StringIO(),
+        )
+        report = manager.gc(None, dry_run=True)
+        self.assertEqual(
+            [(item.worktree.branch, item.reasons, item.status) for item in report],
+            [
+                ("user/dirty", ("idle 12w",), "dirty"),
+                ("user/gone", ("gone from origin",), "clean"),
+                ("user/merged", ("merged",), "clean"),
+            ],
+        )
+        runner.commands.clear()
+        self.assertEqual(manager.gc(None, fetch=False, dry_run=True), report)
+        queries = [command for command in runner.commands if "for-each-ref" in command]
+        self.assertEqual(len(queries), 1 if manager.supports_ahead_behind() else 2)
+        self.assertIn("would remove", manager.stdout.getvalue())  # type: ignore[attr-defined]
+        self.assertIn("keep (dirty)", manager.stdout.getvalue())  # type: ignore[attr-defined]
+        with self.assertRaisesRegex(WTError, "gc cancelled"):
+            manager.gc(None, fetch=False)
+        self.assertTrue(merged.exists())
+
+        self.manager.gc(None, fetch=False, yes=True)
+        self.assertFalse(merged.exists())
+        self.assertFalse(gone.exists())
+        self.assertTrue(fresh.exists())
+        self.assertTrue(active.exists())
+        self.assertTrue(dirty.exists())
+        self.assertEqual(self.tools.removed, [gone, merged])
+        branches = run("git", "branch", "--format=%(refname:short)", cwd=self.project).stdout
+        self.assertIn("user/merged", branches.split())
+
+    def test_gc_keeps_a_worktree_created_just_now(self) -> None:
+        # The base commit is years old; the worktree on top of it is brand new.
+        subprocess.run(
+            ["git", "commit", "--amend", "--no-edit"],
+            cwd=self.seed,
+            env={**os.environ, "GIT_COMMITTER_DATE": "2000-01-01T00:00:00"},
+            check=True,
+            capture_output=True,
+        )
+        run("git", "push", "--force", "origin", "main", cwd=self.seed)
+        run("git", "fetch", "origin", cwd=self.project)
+        destination = self.new("user/a")
+        self.assertEqual(self.manager.gc(None, yes=True), [])
+        self.assertTrue(destination.exists())
+
+    def test_gc_skips_a_project_without_origin_and_collects_the_rest(self) -> None:
+        merged = self.new("user/merged")
+        (merged / "merged").write_text("merged\n")
+        run("git", "add", "merged", cwd=merged)
+        run("git", "commit", "-m", "merged", cwd=merged)
+        run("git", "push", "origin", "HEAD:main", cwd=merged)
+        run("git", "pull", "--ff-only", "origin", "main", cwd=self.seed)
+        (self.seed / "README").write_text("moved on\n")
+        run("git", "commit", "-am", "moved on", cwd=self.seed)
+        run("git", "push", "origin", "main", cwd=self.seed)
+        local = self.projects / "local"
+        run("git", "init", "-q", "-b", "main", str(local))
+        run("git", "config", "user.name", "WT Test", cwd=local)
+        run("git", "config", "user.email", "wt@example.invalid", cwd=local)
+        run("git", "commit", "-q", "--allow-empty", "-m", "initial", cwd=local)
+        stranded = self.root / "local-stranded"
+        run("git", "worktree", "add", "-q", "-b", "user/stranded", str(stranded), cwd=local)
+
+        report = self.manager.gc(None, yes=True)
+        self.assertEqual([item.worktree.path for item in report], [merged])
+        self.assertFalse(merged.exists())
+        self.assertTrue(stranded.exists())
+        output = self.output.getvalue()
+        self.assertIn("local: fetch failed (fatal: ", output)
+        self.assertIn("local: skipped (could not determine origin's default branch", output)
+
+    def test_batch_integrations_share_one_session_index_and_bulk_zoxide(self) -> None:
+        runner = Mock(spec=Runner)
+        runner.run.return_value = subprocess.CompletedProcess(
+            args=["tmux"],
+            returncode=0,
+            stdout="one\t/tmp/a\ntwo\t/tmp/b\nthree\t/tmp/c/src\nfour\t/tmp/cc\n",
+        )
+        tools = ExternalTools(runner, which=lambda command: f"/bin/{command}")
+
+        tools.kill_tmux_sessions([Path("/tmp/a"), Path("/tmp/c")])
+        tools.kill_tmux_sessions([Path("/tmp/b"), Path("/tmp/a")])
+        commands = [call.args[0] for call in runner.run.call_args_list]
+        self.assertEqual([command[1] for command in commands].count("list-sessions"), 1)
+        killed = [command[-1] for command in commands if command[1] == "kill-session"]
+        self.assertEqual(killed, ["=one", "=three", "=two"])
+
+        runner.run.reset_mock()
+        tools.zoxide_remove_all([Path("/tmp/a"), Path("/tmp/c")])
+        self.assertEqual(runner.run.call_args.args[0], ["zoxide", "remove", "/tmp/a", "/tmp/c"])
+
     def test_clean_preflights_locked_worktrees(self) -> None:
         first = self.new("user/first")
         second = self.new("user/locked")
@@ -254,6 +738,425 @@ class WorktreeTests(unittest.TestCase):
         self.assertIn(str(clean), table)
         self.assertIn(str(dirty), table)
 
+    def test_list_probes_status_concurrently_with_stable_order(self) -> None:
+        for name in ("user/c", "user/a", "user/b"):
+            self.new(name)
+        (self.root / "demo-a" / "untracked").write_text("dirty")
+
+        serial, parallel = (
+            WorktreeManager(
+                root=self.root,
+                cwd=self.projects,
+                tools=self.tools,  # type: ignore[arg-type]
+                stdout=io.StringIO(),
+                jobs=jobs,
+            ).list(None)
+            for jobs in (1, 3)
+        )
+        self.assertEqual(serial, parallel)
+        self.assertEqual(
+            [(row[1].branch, row[2]) for row in parallel],
+            [("user/a", "dirty"), ("user/b", "clean"), ("user/c", "clean")],
+        )
+
+    def test_list_reports_ahead_behind_and_age_with_one_ref_query_per_project(self) -> None:
+        ahead = self.new("user/ahead")
+        self.new("user/even")
+        (ahead / "change").write_text("change\n")
+        run("git", "add", "change", cwd=ahead)
+        run("git", "commit", "-m", "change", cwd=ahead)
+        self.manager.list(None)
+
+        runner = CountingRunner()
+        manager = WorktreeManager(
+            root=self.root,
+            cwd=self.projects,
+            runner=runner,
+            tools=self.tools,  # type: ignore[arg-type]
+            stdout=io.StringIO(),
+        )
+        rows = {row[1].branch: row[1] for row in manager.list(None)}
+        queries = [command for command in runner.commands if "for-each-ref" in command]
+        self.assertEqual(len(queries), 1)
+        self.assertLess(time.time() - (rows["user/ahead"].committed or 0), 600)
+        if manager.supports_ahead_behind():
+            self.assertEqual((rows["user/ahead"].ahead, rows["user/ahead"].behind), (1, 0))
+            self.assertEqual((rows["user/even"].ahead, rows["user/even"].behind), (0, 0))
+            self.assertIn("+1 -0", manager.stdout.getvalue())  # type: ignore[attr-defined]
+        else:
+            self.assertIsNone(rows["user/ahead"].ahead)
+        self.assertEqual(
+            manager.parse_branch_info("refs/heads/user/x\x001700000000\x003 2\n"),
+            {"user/x": (3, 2, 1700000000)},
+        )
+
+    def test_ahead_behind_support_comes_from_git_version_once_per_binary(self) -> None:
+        self.assertEqual(self.manager.parse_git_version("git version 2.41.0\n"), (2, 41))
+        self.assertEqual(
+            self.manager.parse_git_version("git version 2.39.3 (Apple Git-145)"), (2, 39)
+        )
+        self.assertEqual(self.manager.parse_git_version("garbage"), (0, 0))
+
+        def manager_with(runner: Runner) -> WorktreeManager:
+            return WorktreeManager(
+                root=self.root,
+                cwd=self.projects,
+                runner=runner,
+                tools=self.tools,  # type: ignore[arg-type]
+                stdout=io.StringIO(),
+            )
+
+        runner = CountingRunner()
+        installed = self.manager.parse_git_version(run("git", "version").stdout)
+        supported = manager_with(runner).supports_ahead_behind()
+        self.assertEqual(supported, installed >= (2, 41))
+        self.assertEqual(runner.commands, [["git", "version"]])
+        runner.commands.clear()
+        self.assertEqual(manager_with(runner).supports_ahead_behind(), supported)
+        self.assertEqual(runner.commands, [])
+
+    def test_du_counts_shared_data_once_and_rescans_only_changed_directories(self) -> None:
+        first = self.new("user/first")
+        second = self.new("user/second")
+        (first / "build").mkdir()
+        (first / "build/blob").write_bytes(b"x" * 65536)
+        os.link(first / "build/blob", first / "build/blob-again")
+        os.link(first / "build/blob", second / "blob")
+        (first / "build/clone").write_bytes(b"y" * 8192)
+        (second / "clone").write_bytes(b"y" * 8192)
+        blob_blocks = (first / "build/blob").stat().st_blocks * 512
+        clone_blocks = (second / "clone").stat().st_blocks * 512
+
+        def shared_extents(self: DiskUsage, path: str) -> list[tuple[int, int]]:
+            return [(1 << 20, clone_blocks)] if path.endswith("clone") else []
+
+        with patch.object(DiskUsage, "shared_extents", shared_extents):
+            rows, total = self.manager.du(None)
+        sizes = {worktree.branch: totals for _, worktree, totals in rows}
+        self.assertGreaterEqual(sizes["user/first"].apparent, 65536 + 8192)
+        self.assertLess(sizes["user/first"].apparent, 2 * 65536)
+        self.assertEqual(
+            total.apparent,
+            sizes["user/first"].apparent + sizes["user/second"].apparent - 65536,
+        )
+        self.assertEqual(
+            total.disk,
+            sizes["user/first"].disk + sizes["user/second"].disk - blob_blocks - clone_blocks,
+        )
+        self.assertIn("TOTAL", self.output.getvalue())
+
+        with patch.object(
+            DiskUsage, "scan_directory", autospec=True, side_effect=DiskUsage.scan_directory
+        ) as scanned:
+            again, _ = self.manager.du(None)
+            self.assertEqual(scanned.call_count, 0)
+            self.assertEqual([row[2].disk for row in again], [row[2].disk for row in rows])
+            (first / "build/more").write_bytes(b"z" * 4096)
+            self.manager.du("demo")
+            self.assertEqual([call.args[1] for call in scanned.call_args_list], [first / "build"])
+
+        other = self.projects / "other"
+        run("git", "clone", str(self.remote), str(other))
+        self.manager.new(str(other), "user/other", None)
+        with patch.object(DiskUsage, "save", autospec=True, side_effect=DiskUsage.save) as saved:
+            listed = self.manager.list(None, sizes=True)
+        self.assertEqual(saved.call_count, 1)
+        self.assertEqual(len({row[0] for row in listed}), 2)
+        self.assertTrue(all(row[1].disk for row in listed))
+        self.assertIn("DISK", self.output.getvalue().splitlines()[-4])
+
+    def test_list_streams_table_and_ndjson_rows(self) -> None:
+        self.new("user/clean")
+        dirty = self.new("user/dirty")
+        (dirty / "new-file").write_text("dirty")
+        table_rows = self.manager.list(None)
+
+        for output in ("stream", "ndjson"):
+            stream = io.StringIO()
+            manager = WorktreeManager(
+                root=self.root,
+                cwd=self.projects,
+                tools=self.tools,  # type: ignore[arg-type]
+                stdout=stream,
+            )
+            self.assertEqual(manager.list(None, output=output), table_rows)
+            lines = stream.getvalue().splitlines()
+            if output == "stream":
+                self.assertEqual(
+                    lines[0].split(), ["PROJECT", "BRANCH", "STATUS", "BASE", "AGE", "PATH"]
+                )
+                self.assertEqual(len({line.index("  /") for line in lines[1:]}), 1)
+            else:
+                records = [json.loads(line) for line in lines]
+                self.assertEqual(
+                    [(record["branch"], record["status"]) for record in records],
+                    [("user/clean", "clean"), ("user/dirty", "dirty")],
+                )
+
+    def test_daemon_serves_list_from_warm_state_and_tracks_new_worktrees(self) -> None:
+        clean = self.new("user/clean")
+        (clean / "src/deep").mkdir(parents=True)
+        client = DaemonClient(self.manager.daemon_socket)
+        self.assertIsNone(client.list_rows(None, "ignored"))
+
+        runner = CountingRunner()
+        daemon_manager = WorktreeManager(
+            root=self.root,
+            cwd=self.projects,
+            runner=runner,
+            tools=self.tools,  # type: ignore[arg-type]
+            stdout=io.StringIO(),
+        )
+        loop = asyncio.new_event_loop()
+        ready = threading.Event()
+        serving = loop.create_task(Daemon(daemon_manager).serve(ready.set))
+        thread = threading.Thread(
+            target=lambda: loop.run_until_complete(asyncio.gather(serving, return_exceptions=True))
+        )
+        thread.start()
+        try:
+            self.assertTrue(ready.wait(10))
+            rows = client.list_rows(None, "ignored")
+            self.assertEqual(rows, self.manager.list(None))
+            probes = [command for command in runner.commands if "status" in command]
+            time.sleep(0.3)
+            self.assertEqual(client.list_rows(None, "ignored"), rows)
+            self.assertEqual(
+                [command for command in runner.commands if "status" in command], probes
+            )
+
+            (clean / "src/deep/edit").write_text("edit")
+            rows = client.list_rows(None, "ignored")
+            self.assertEqual([row[2] for row in rows or []], ["dirty"])
+            (clean / "src/deep/edit").unlink()
+
+            # Not ignored by Git, so watched even though discovery skips vendor/.
+            (clean / "vendor").mkdir()
+            rows = client.list_rows(None, "ignored")
+            self.assertEqual([row[2] for row in rows or []], ["clean"])
+            time.sleep(0.5)
+            (clean / "vendor/edit").write_text("edit")
+            rows = client.list_rows(None, "ignored")
+            self.assertEqual([row[2] for row in rows or []], ["dirty"])
+            shutil.rmtree(clean / "vendor")
+
+            dirty = self.new("user/dirty")
+            (dirty / "new-file").write_text("dirty")
+            rows = client.list_rows(self.project.resolve(), "ignored")
+            self.assertEqual(
+                [(row[1].branch, row[2]) for row in rows or []],
+                [("user/clean", "clean"), ("user/dirty", "dirty")],
+            )
+            self.assertEqual(client.list_rows(None, "untracked"), self.manager.list(None))
+        finally:
+            loop.call_soon_threadsafe(serving.cancel)
+            thread.join(10)
+            loop.close()
+        self.assertFalse(self.manager.daemon_socket.exists())
+
+    def test_completion_answers_from_snapshot_left_by_commands(self) -> None:
+        run("git", "push", "origin", "main:release", cwd=self.seed)
+        run("git", "fetch", "origin", cwd=self.project)
+        self.new("user/one")
+        self.new("user/two")
+        self.manager.discover_projects()
+        self.manager.completions.save()
+
+        def complete(*words: str) -> list[str]:
+            snapshot = str(self.manager.completions.path)
+            return wt_complete.complete(list(words), snapshot, str(self.projects.resolve()))
+
+        self.assertEqual(complete("d"), ["delete", "du", "daemon"])
+        self.assertEqual(complete("new", ""), ["demo"])
+        self.assertEqual(complete("--depth", "2", "delete", "demo", ""), ["user/one", "user/two"])
+        self.assertEqual(complete("new", "demo", "user/x", "--base", "r"), ["release"])
+        self.assertEqual(complete("list", "--output", "n"), ["ndjson"])
+        self.assertEqual(complete("clean", "--"), ["--force", "--yes", "--dirty-check"])
+
+        self.manager.delete("demo", "user/one", force=False)
+        self.manager.completions.save()
+        self.assertEqual(complete("delete", str(self.project), ""), ["user/two"])
+
+    def test_completion_tables_match_parser(self) -> None:
+        parser = build_parser()
+
+        def options(parser: argparse.ArgumentParser) -> dict[str, bool]:
+            return {
+                name: action.nargs != 0
+                for action in parser._actions
+                for name in action.option_strings
+                if name not in ("-h", "--help")
+            }
+
+        commands = next(
+            action for action in parser._actions if isinstance(action, argparse._SubParsersAction)
+        ).choices
+        self.assertEqual(options(parser), wt_complete.GLOBAL_OPTIONS)
+        self.assertEqual(set(commands), set(wt_complete.COMMANDS))
+        for name, subparser in commands.items():
+            self.assertEqual(options(subparser), wt_complete.COMMAND_OPTIONS[name], name)
+
+    def test_managed_projects_index_skips_git_until_metadata_changes(self) -> None:
+        first = self.new("user/first")
+        runner = CountingRunner()
+        manager = WorktreeManager(
+            root=self.root,
+            cwd=self.projects,
+            runner=runner,
+            tools=self.tools,  # type: ignore[arg-type]
+        )
+        self.assertEqual(manager.managed_projects(), [self.project.resolve()])
+        self.assertTrue((self.root / ".wt" / "index.json").is_file())
+
+        runner.commands.clear()
+        self.assertEqual(manager.managed_projects(), [self.project.resolve()])
+        self.assertEqual(runner.commands, [])
+        self.assertEqual(manager.index.lookup(first), self.project.resolve())
+
+        run("git", "worktree", "add", str(self.root / "demo-extra"), cwd=self.project)
+        self.assertIsNone(manager.index.lookup(first))
+        self.assertEqual(manager.managed_projects(), [self.project.resolve()])
+        self.assertIsNotNone(manager.index.lookup(first))
+
+        self.manager.delete(str(self.project), "user/first", force=False)
+        self.assertIsNone(WorktreeManager(root=self.root).index.lookup(first))
+
+    def test_metadata_reader_matches_git_without_subprocesses(self) -> None:
+        first = self.new("user/first")
+        locked = self.new("user/locked")
+        run("git", "worktree", "lock", "--reason", "test lock", str(locked), cwd=self.project)
+        run("git", "checkout", "--detach", cwd=first)
+        run("git", "pack-refs", "--all", cwd=self.project)
+
+        runner = CountingRunner()
+        manager = WorktreeManager(
+            root=self.root,
+            cwd=self.projects,
+            runner=runner,
+            tools=self.tools,  # type: ignore[arg-type]
+        )
+        listing = run("git", "worktree", "list", "--porcelain", cwd=self.project).stdout
+        self.assertEqual(manager.worktrees_for(self.project), manager.parse_worktrees(listing))
+        self.assertEqual(manager.owner_for_worktree(locked), self.project.resolve())
+        self.assertEqual(manager.validate_project(first), self.project.resolve())
+        self.assertEqual(runner.commands, [])
+
+        # Layouts the reader does not understand fall back to git.
+        with self.assertRaisesRegex(WTError, "bare repositories"):
+            manager.validate_project(self.remote)
+        self.assertTrue(runner.commands)
+
+    def test_async_operations_match_sync_with_native_and_injected_runners(self) -> None:
+        self.new("user/first")
+        dirty = self.new("user/dirty")
+        (dirty / "untracked").write_text("dirty")
+        expected = self.manager.list(None)
+
+        runner = CountingRunner()
+        injected = WorktreeManager(
+            root=self.root,
+            cwd=self.projects,
+            runner=runner,
+            tools=self.tools,  # type: ignore[arg-type]
+            stdout=io.StringIO(),
+        )
+        native = WorktreeManager(
+            root=self.root,
+            cwd=self.projects,
+            tools=self.tools,  # type: ignore[arg-type]
+            stdout=io.StringIO(),
+        )
+        self.assertIsNone(injected.async_runner)
+        self.assertIsInstance(native.async_runner, AsyncRunner)
+
+        async def describe(manager: WorktreeManager) -> list[tuple[Path, Worktree, str]]:
+            rows = []
+            for project in await manager.managed_projects_async():
+                listing = await manager.managed_for_async(project)
+                for worktree in await manager.with_branch_info_async(project, listing):
+                    rows.append((project, worktree, await manager.status_of_async(worktree)))
+            return rows
+
+        for manager in (injected, native):
+            (self.root / ".wt" / "index.json").unlink(missing_ok=True)
+            self.assertEqual(asyncio.run(describe(manager)), expected)
+            self.assertEqual(manager.managed_projects(), [self.project.resolve()])
+            self.assertEqual(asyncio.run(manager.list_async(None)), expected)
+            self.assertEqual(asyncio.run(manager.list_async(None, output="ndjson")), expected)
+            self.assertEqual(
+                asyncio.run(manager.discover_projects_async()), [self.project.resolve()]
+            )
+        self.assertTrue(any("status" in command for command in runner.commands))
+
+        with self.assertRaisesRegex(WTError, "dirty worktrees found; nothing removed"):
+            asyncio.run(native.clean_async(str(self.project), force=False, yes=True))
+        removed = asyncio.run(native.clean_async(str(self.project), force=True, yes=True))
+        self.assertEqual(len(removed), 2)
+        self.assertEqual(self.manager.managed_for(self.project), [])
+        self.assertEqual(set(self.tools.killed), {row[1].path for row in expected})
+
+    def test_async_runner_reports_failures_like_runner(self) -> None:
+        runner = AsyncRunner(limit=2)
+        result = asyncio.run(runner.run(["git", "--version"]))
+        self.assertTrue(result.stdout.startswith("git version"))
+        with self.assertRaisesRegex(WTError, "command failed: git definitely-not-a-command"):
+            asyncio.run(runner.run(["git", "definitely-not-a-command"]))
+        with self.assertRaisesRegex(WTError, "required command not found"):
+            asyncio.run(runner.run(["wt-missing-command"]))
+
+    def test_profile_trace_records_every_subprocess(self) -> None:
+        self.new("user/traced")
+        self.manager.list(None)
+        trace = CommandTrace()
+        manager = WorktreeManager(
+            root=self.root,
+            cwd=self.projects,
+            runner=Runner(trace),
+            async_runner=AsyncRunner(trace=trace),
+            tools=self.tools,  # type: ignore[arg-type]
+            stdout=io.StringIO(),
+        )
+        manager.list(None)
+        project = self.project.resolve()
+
+        async def describe() -> list[str]:
+            listing = await manager.managed_for_async(project)
+            described = await manager.with_branch_info_async(project, listing)
+            return [await manager.status_of_async(worktree) for worktree in described]
+
+        self.assertEqual(asyncio.run(describe()), ["clean"])
+        labels = [CommandTrace.label(record.argv) for record in trace.records]
+        self.assertEqual(labels, ["git for-each-ref", "git status"] * 2)
+        self.assertEqual(
+            CommandTrace.label(("git", "-C", "/x", "-c", "a=b", "--no-pager", "fetch", "origin")),
+            "git fetch",
+        )
+        self.assertIn(("git status", 2), [row[:2] for row in trace.summary()])
+
+        summary = io.StringIO()
+        trace.print_summary(summary)
+        self.assertIn("git status", summary.getvalue())
+        self.assertIn("4 subprocess(es)", summary.getvalue())
+        events = trace.chrome_trace()["traceEvents"]
+        assert isinstance(events, list)
+        self.assertEqual({event["ph"] for event in events}, {"X"})
+        self.assertEqual(events[0]["args"]["argv"][0], "git")
+
+        manager.runner.spawn(["true"])
+        self.assertEqual(CommandTrace.label(trace.records[-1].argv), "true")
+
+    def test_benchmark_counts_subprocesses_and_flags_regressions(self) -> None:
+        report = bench_wt.run_benchmark(bench_wt.FleetShape(1, 2, 3, 3), jobs=2)
+        results = {result["operation"]: result for result in report["results"]}
+        self.assertEqual(
+            results["list"]["by_command"], {"git status": 2, "git for-each-ref": 1}
+        )
+        self.assertEqual(bench_wt.compare(report, report), [])
+
+        baseline = json.loads(json.dumps(report))
+        baseline["results"][1]["subprocesses"] -= 1
+        self.assertEqual(len(bench_wt.compare(report, baseline)), 1)
+
     def test_linked_worktree_argument_normalizes_to_primary_project(self) -> None:
         linked = self.new("user/linked")
         destination = self.manager.new(str(linked), "user/from-linked", "main")
@@ -262,6 +1165,64 @@ class WorktreeTests(unittest.TestCase):
         owners = self.manager.managed_for(self.project)
         self.assertEqual({item.branch for item in owners}, {"user/linked", "user/from-linked"})
 
+    def test_streaming_picker_stops_feeding_and_cancels_discovery(self) -> None:
+        closed: list[int] = []
+
+        def endless() -> Generator[str, None, None]:
+            try:
+                number = 0
+                while True:
+                    number += 1
+                    yield f"choice{number}"
+            finally:
+                closed.append(number)
+
+        first_line = [sys.executable, "-c", "import sys; print(sys.stdin.readline().strip())"]
+        result, written = Runner().feed(first_line, endless())
+        self.assertEqual(result.stdout, "choice1\n")
+        self.assertEqual(len(closed), 1)
+        self.assertGreaterEqual(closed[0], written)
+
+        for number in range(12):
+            run("git", "init", "-q", str(self.projects / f"extra{number:02d}"))
+        bin_dir = self.base / "bin"
+        bin_dir.mkdir()
+        fzf = bin_dir / "fzf"
+        fzf.write_text(f"#!{sys.executable}\nimport sys\nprint(sys.stdin.readline().strip())\n")
+        fzf.chmod(0o755)
+        manager = WorktreeManager(
+            root=self.root,
+            cwd=self.projects,
+            tools=ExternalTools(Runner()),
+            stdout=io.StringIO(),
+            jobs=1,
+        )
+        validated: list[str] = []
+        gate = threading.Event()
+        validate = manager.try_validate_project
+
+        def validate_extras_slowly(path: Path) -> Path | None:
+            validated.append(path.name)
+            if path.name.startswith("extra"):
+                gate.wait(5)
+            return validate(path)
+
+        manager.try_validate_project = validate_extras_slowly  # type: ignore[method-assign]
+        started = time.monotonic()
+        try:
+            with patch.dict(os.environ, {"PATH": f"{bin_dir}{os.pathsep}{os.environ['PATH']}"}):
+                # fzf exits after the first choice while extra00 is still validating.
+                self.assertEqual(manager.choose_project(None), self.project.resolve())
+            self.assertLess(time.monotonic() - started, 2)
+        finally:
+            gate.set()
+        self.assertEqual(validated, ["projects", "demo", "extra00"])
+
+        self.tools.selections = ["demo"]
+        self.assertEqual(
+            self.manager.new(None, "user/picked", "main"), self.root / "demo-picked"
+        )
+
     def test_interactive_tools_preserve_terminal_output(self) -> None:
         runner = Mock(spec=Runner)
         runner.run.return_value = subprocess.CompletedProcess(
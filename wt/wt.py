@@ -4,13 +4,113 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import contextlib
+import ctypes
+import errno
+import fcntl
+import hashlib
+import json
+import math
 import os
 import shutil
+import socket
+import struct
 import subprocess
 import sys
-from dataclasses import dataclass
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Callable, TextIO
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+    TextIO,
+    TypeVar,
+)
+
+import wt_complete
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Git status probes are I/O bound, so a handful of concurrent processes keeps
+# large fleets fast without flooding the disk.
+DEFAULT_JOBS = 8
+# Dirty-check strictness, from cheapest to safest. Each level also reports
+# everything the previous one does.
+DIRTY_MODES = {
+    "tracked": ("--untracked-files=no",),
+    "untracked": ("--untracked-files=normal",),
+    # "matching" reports an ignored directory without descending into it.
+    "ignored": ("--untracked-files=normal", "--ignored=matching"),
+}
+DEFAULT_DIRTY_MODE = "ignored"
+# `list` output: a sorted table, a table printed project by project as
+# statuses resolve, or one JSON object per worktree for scripts.
+LIST_OUTPUTS = ("table", "stream", "ndjson")
+TABLE_HEADERS = ("PROJECT", "BRANCH", "STATUS", "BASE", "AGE", "PATH")
+DU_HEADERS = ("PROJECT", "BRANCH", "APPARENT", "DISK", "PATH")
+GC_HEADERS = ("PROJECT", "BRANCH", "REASON", "ACTION", "PATH")
+# `gc` treats a branch whose last commit is older than this as idle.
+DEFAULT_GC_IDLE_DAYS = 30
+# Ordered by width so the last one sizes a column before statuses are known.
+STATUSES = ("dirty", "clean", "missing")
+# Directory names project discovery never descends into.
+DEFAULT_DISCOVERY_IGNORE = frozenset(
+    {
+        ".cache",
+        ".git",
+        ".venv",
+        "__pycache__",
+        "build",
+        "dist",
+        "node_modules",
+        "target",
+        "vendor",
+        "venv",
+    }
+)
+
+# The daemon watches every directory of a worktree that Git does not ignore,
+# up to this many per worktree. Statuses of worktrees too large to watch fully
+# are re-probed on request once they are older than DAEMON_STATUS_TTL.
+DAEMON_MAX_WATCHES = 2048
+DAEMON_STATUS_TTL = 5.0
+# How long a burst of changes (a checkout, a build) may settle before the
+# changed worktrees are re-probed.
+DAEMON_SETTLE = 0.2
+DAEMON_PROTOCOL = 1
+
+# Optional git features are decided from `git version`, whose output is never
+# localized; the answer is kept per git executable (path and mtime), so an
+# upgrade is noticed immediately.
+GIT_FEATURE_TTL = 30 * 24 * 60 * 60
+# The first git whose for-each-ref knows %(ahead-behind:...).
+AHEAD_BEHIND_GIT = (2, 41)
+
+# ioctl that makes a file share another's extents (btrfs, XFS): linux/fs.h.
+FICLONE = 0x40049409
+# ioctl that maps a file's extents, and the extent flags `du` reads: linux/fiemap.h.
+FIEMAP = 0xC020660B
+FIEMAP_HEADER = struct.Struct("=QQIIII")
+FIEMAP_EXTENT = struct.Struct("=QQQQQIIII")
+FIEMAP_EXTENT_LAST = 0x1
+FIEMAP_EXTENT_SHARED = 0x2000
+
+# Upper bound for `wt pool --size`; each slot is a full checkout.
+MAX_POOL_SIZE = 8
+
+# `new` skips fetching a base branch that was fetched this recently.
+DEFAULT_FETCH_TTL = 60
+
+# How long origin's advertised default branch is trusted before asking again.
+DEFAULT_BRANCH_TTL = 24 * 60 * 60
 
 
 class WTError(RuntimeError):
@@ -36,9 +136,151 @@ def terminal_input(prompt: str) -> str:
     return value.rstrip("\n")
 
 
+def command_failed(command: list[str], stdout: str | None, stderr: str | None) -> WTError:
+    detail = (stderr or stdout or "").strip()
+    message = f"command failed: {' '.join(command)}"
+    return WTError(f"{message}: {detail}" if detail else message)
+
+
+@dataclass(frozen=True)
+class CommandRecord:
+    argv: tuple[str, ...]
+    cwd: str | None
+    start: float
+    duration: float
+    returncode: int | None
+    output_bytes: int
+    thread: int
+
+
+class CommandTrace:
+    """Timing record of every subprocess a runner starts, for `wt --profile`."""
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self.clock = clock
+        self.origin = clock()
+        self.records: list[CommandRecord] = []
+        self.lock = threading.Lock()
+
+    def record(
+        self,
+        command: list[str],
+        cwd: Path | None,
+        started: float,
+        returncode: int | None,
+        *outputs: str | bytes | None,
+    ) -> None:
+        finished = self.clock()
+        size = sum(
+            len(output.encode(errors="replace") if isinstance(output, str) else output)
+            for output in outputs
+            if output
+        )
+        record = CommandRecord(
+            argv=tuple(command),
+            cwd=str(cwd) if cwd is not None else None,
+            start=started - self.origin,
+            duration=finished - started,
+            returncode=returncode,
+            output_bytes=size,
+            thread=threading.get_ident(),
+        )
+        with self.lock:
+            self.records.append(record)
+
+    @staticmethod
+    def label(argv: tuple[str, ...]) -> str:
+        """Group by program and subcommand, skipping git's global options."""
+        if not argv:
+            return "?"
+        rest = iter(argv[1:])
+        for argument in rest:
+            if argument in {"-C", "-c"}:
+                next(rest, None)
+            elif not argument.startswith("-"):
+                return f"{Path(argv[0]).name} {argument}"
+        return Path(argv[0]).name
+
+    @staticmethod
+    def percentile(durations: list[float], fraction: float) -> float:
+        ordered = sorted(durations)
+        return ordered[max(1, math.ceil(len(ordered) * fraction)) - 1]
+
+    def summary(self) -> list[tuple[str, int, float, float, float]]:
+        """Rows of (label, count, total, p50, p95) in seconds, slowest total first."""
+        groups: dict[str, list[float]] = {}
+        with self.lock:
+            for record in self.records:
+                groups.setdefault(self.label(record.argv), []).append(record.duration)
+        rows = [
+            (
+                label,
+                len(durations),
+                sum(durations),
+                self.percentile(durations, 0.5),
+                self.percentile(durations, 0.95),
+            )
+            for label, durations in groups.items()
+        ]
+        return sorted(rows, key=lambda row: (-row[2], row[0]))
+
+    def print_summary(self, stream: TextIO) -> None:
+        rows = self.summary()
+        elapsed = self.clock() - self.origin
+        width = max([len("COMMAND"), *(len(row[0]) for row in rows)])
+        print(
+            f"{'COMMAND':<{width}}  {'COUNT':>5}  {'TOTAL ms':>9}  {'P50 ms':>8}  {'P95 ms':>8}",
+            file=stream,
+        )
+        for label, count, total, p50, p95 in rows:
+            print(
+                f"{label:<{width}}  {count:>5}  {total * 1000:>9.1f}  "
+                f"{p50 * 1000:>8.1f}  {p95 * 1000:>8.1f}",
+                file=stream,
+            )
+        print(
+            f"{sum(row[1] for row in rows)} subprocess(es), "
+            f"{sum(row[2] for row in rows) * 1000:.1f} ms in subprocesses, "
+            f"{elapsed * 1000:.1f} ms elapsed",
+            file=stream,
+        )
+
+    def chrome_trace(self) -> dict[str, object]:
+        """Trace Event Format, loadable in chrome://tracing or Perfetto."""
+        with self.lock:
+            records = list(self.records)
+        return {
+            "displayTimeUnit": "ms",
+            "traceEvents": [
+                {
+                    "name": self.label(record.argv),
+                    "cat": "subprocess",
+                    "ph": "X",
+                    "ts": round(record.start * 1_000_000),
+                    "dur": round(record.duration * 1_000_000),
+                    "pid": os.getpid(),
+                    "tid": record.thread,
+                    "args": {
+                        "argv": list(record.argv),
+                        "cwd": record.cwd,
+                        "exit": record.returncode,
+                        "output_bytes": record.output_bytes,
+                    },
+                }
+                for record in records
+            ],
+        }
+
+    def write_chrome_trace(self, path: Path) -> None:
+        path.write_text(json.dumps(self.chrome_trace()), encoding="utf-8")
+
+
 class Runner:
     """Subprocess boundary, kept separate so command behavior is testable."""
 
+    def __init__(self, trace: CommandTrace | None = None) -> None:
+        self.trace = trace
+
     def run(
         self,
         command: list[str],
@@ -49,8 +291,11 @@ class Runner:
         capture: bool = True,
         stderr_to_terminal: bool = False,
     ) -> subprocess.CompletedProcess[str]:
+        started = time.perf_counter()
+        returncode: int | None = None
+        outputs: tuple[str | None, ...] = ()
         try:
-            return subprocess.run(
+            result = subprocess.run(
                 command,
                 cwd=cwd,
                 check=check,
@@ -59,12 +304,232 @@ class Runner:
                 text=True,
                 input=input_text,
             )
+            returncode, outputs = result.returncode, (result.stdout, result.stderr)
+            return result
         except FileNotFoundError as exc:
             raise WTError(f"required command not found: {command[0]}") from exc
         except subprocess.CalledProcessError as exc:
-            detail = (exc.stderr or exc.stdout or "").strip()
-            message = f"command failed: {' '.join(command)}"
-            raise WTError(f"{message}: {detail}" if detail else message) from exc
+            returncode, outputs = exc.returncode, (exc.stdout, exc.stderr)
+            raise command_failed(command, exc.stdout, exc.stderr) from exc
+        finally:
+            if self.trace is not None:
+                self.trace.record(command, cwd, started, returncode, *outputs)
+
+    def first_line(
+        self, command: list[str], *, cwd: Path | None = None
+    ) -> tuple[str, int | None]:
+        """Run command until it prints one line of output.
+
+        Returns that line and the exit status, or None as the status when the
+        process was stopped early because it had already answered.
+        """
+        started = time.perf_counter()
+        try:
+            process = subprocess.Popen(
+                command,
+                cwd=cwd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+            )
+        except FileNotFoundError as exc:
+            raise WTError(f"required command not found: {command[0]}") from exc
+        line = ""
+        returncode: int | None = None
+        try:
+            with process:
+                assert process.stdout is not None
+                line = process.stdout.readline()
+                if line:
+                    # SIGTERM lets git run its lockfile cleanup handlers.
+                    process.terminate()
+                    return line, None
+                returncode = process.wait()
+                return "", returncode
+        finally:
+            if self.trace is not None:
+                self.trace.record(command, cwd, started, returncode, line)
+
+    def spawn(self, command: list[str]) -> None:
+        """Start command detached from this process and its terminal, without waiting."""
+        started = time.perf_counter()
+        try:
+            subprocess.Popen(
+                command,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
+        except FileNotFoundError as exc:
+            raise WTError(f"required command not found: {command[0]}") from exc
+        finally:
+            if self.trace is not None:
+                self.trace.record(command, None, started, None)
+
+    def feed(
+        self,
+        command: list[str],
+        lines: Generator[str, None, None],
+        *,
+        stop: Callable[[], object] | None = None,
+    ) -> tuple[subprocess.CompletedProcess[str], int]:
+        """Run command while writing lines to its stdin as they are produced.
+
+        Used for fzf, which shows candidates as they arrive. As soon as the
+        process exits, stop is called so a producer waiting for its next line
+        can give up, and lines is closed so it cancels pending work.
+        Returns the result and how many lines were written.
+        """
+        started = time.perf_counter()
+        try:
+            process = subprocess.Popen(
+                command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True
+            )
+        except FileNotFoundError as exc:
+            lines.close()
+            raise WTError(f"required command not found: {command[0]}") from exc
+        written = 0
+
+        def write() -> None:
+            nonlocal written
+            assert process.stdin is not None
+            try:
+                for line in lines:
+                    process.stdin.write(line + "\n")
+                    process.stdin.flush()
+                    written += 1
+            except OSError:
+                pass
+            finally:
+                lines.close()
+                with contextlib.suppress(OSError):
+                    process.stdin.close()
+
+        writer = threading.Thread(target=write, daemon=True)
+        writer.start()
+        returncode: int | None = None
+        stdout = ""
+        try:
+            assert process.stdout is not None
+            stdout = process.stdout.read()
+            returncode = process.wait()
+        except BaseException:
+            process.kill()
+            raise
+        finally:
+            if stop is not None:
+                stop()
+            if self.trace is not None:
+                self.trace.record(command, None, started, returncode, stdout)
+        writer.join()
+        return subprocess.CompletedProcess(command, returncode, stdout, None), written
+
+
+class AsyncRunner:
+    """asyncio counterpart of Runner.
+
+    One semaphore per runner caps how many child processes run at once across
+    every coroutine that shares it. Cancelling a caller kills its process.
+    """
+
+    def __init__(self, limit: int = DEFAULT_JOBS, trace: CommandTrace | None = None) -> None:
+        self.limit = max(1, limit)
+        self.trace = trace
+        self._semaphore: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @contextlib.asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.limit)
+            self._loop = loop
+        async with self._semaphore:
+            yield
+
+    @staticmethod
+    async def spawn(command: list[str], **kwargs: Any) -> asyncio.subprocess.Process:
+        try:
+            return await asyncio.create_subprocess_exec(*command, **kwargs)
+        except FileNotFoundError as exc:
+            raise WTError(f"required command not found: {command[0]}") from exc
+
+    @staticmethod
+    async def stop(process: asyncio.subprocess.Process) -> None:
+        if process.returncode is None:
+            with contextlib.suppress(ProcessLookupError):
+                process.terminate()
+            await process.wait()
+
+    async def run(
+        self,
+        command: list[str],
+        *,
+        cwd: Path | None = None,
+        check: bool = True,
+        input_text: str | None = None,
+        capture: bool = True,
+        stderr_to_terminal: bool = False,
+    ) -> subprocess.CompletedProcess[str]:
+        async with self.slot():
+            process = await self.spawn(
+                command,
+                cwd=cwd,
+                stdin=subprocess.PIPE if input_text is not None else subprocess.DEVNULL,
+                stdout=subprocess.PIPE if capture else None,
+                stderr=None if stderr_to_terminal or not capture else subprocess.PIPE,
+            )
+            started = time.perf_counter()
+            stdout = stderr = None
+            try:
+                stdout, stderr = await process.communicate(
+                    input_text.encode() if input_text is not None else None
+                )
+            except asyncio.CancelledError:
+                await self.stop(process)
+                raise
+            finally:
+                if self.trace is not None:
+                    self.trace.record(command, cwd, started, process.returncode, stdout, stderr)
+        result = subprocess.CompletedProcess(
+            command,
+            process.returncode if process.returncode is not None else -1,
+            stdout.decode(errors="replace") if stdout is not None else None,
+            stderr.decode(errors="replace") if stderr is not None else None,
+        )
+        if check and result.returncode != 0:
+            raise command_failed(command, result.stdout, result.stderr)
+        return result
+
+    async def first_line(
+        self, command: list[str], *, cwd: Path | None = None
+    ) -> tuple[str, int | None]:
+        async with self.slot():
+            process = await self.spawn(
+                command,
+                cwd=cwd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+            started = time.perf_counter()
+            line = ""
+            returncode: int | None = None
+            try:
+                assert process.stdout is not None
+                line = (await process.stdout.readline()).decode(errors="replace")
+                if line:
+                    await self.stop(process)
+                    return line, None
+                returncode = await process.wait()
+                return "", returncode
+            except asyncio.CancelledError:
+                await self.stop(process)
+                raise
+            finally:
+                if self.trace is not None:
+                    self.trace.record(command, cwd, started, returncode, line)
 
 
 @dataclass(frozen=True)
@@ -76,6 +541,685 @@ class Worktree:
     detached: bool = False
     locked: bool = False
     lock_reason: str | None = None
+    # Joined in by `list`: commits ahead of and behind origin's default
+    # branch, and the branch tip's committer date (Unix time).
+    ahead: int | None = None
+    behind: int | None = None
+    committed: int | None = None
+    # Joined in by `list --size`: bytes allocated on disk.
+    disk: int | None = None
+
+
+def linked_gitdir(worktree: Path) -> Path | None:
+    """Return the administrative directory a linked worktree's .git file names."""
+    try:
+        content = (worktree / ".git").read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+    prefix = "gitdir: "
+    first = content.splitlines()[0] if content else ""
+    if not first.startswith(prefix):
+        return None
+    gitdir = Path(first[len(prefix) :].strip())
+    if not gitdir.is_absolute():
+        gitdir = worktree / gitdir
+    return gitdir.resolve(strict=False)
+
+
+def read_text_file(path: Path) -> str | None:
+    try:
+        return path.read_text(encoding="utf-8").strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def common_gitdir(worktree: Path) -> Path | None:
+    """Locate the common Git directory for a worktree root without running git."""
+    dot_git = worktree / ".git"
+    if dot_git.is_dir():
+        return dot_git.resolve(strict=False)
+    admin = linked_gitdir(worktree)
+    if admin is None:
+        return None
+    commondir = read_text_file(admin / "commondir")
+    if not commondir:
+        return None
+    common = Path(commondir)
+    if not common.is_absolute():
+        common = admin / common
+    return common.resolve(strict=False)
+
+
+def resolve_ref(common: Path, ref: str) -> str | None:
+    loose = read_text_file(common / ref)
+    if loose:
+        return loose
+    packed = read_text_file(common / "packed-refs") or ""
+    for line in packed.splitlines():
+        if line.startswith(("#", "^")):
+            continue
+        sha, _, name = line.partition(" ")
+        if name == ref:
+            return sha
+    return None
+
+
+def read_head(common: Path, admin: Path) -> tuple[str | None, str | None] | None:
+    """Return (branch, head) for an administrative directory's HEAD file."""
+    head = read_text_file(admin / "HEAD")
+    if not head:
+        return None
+    if head.startswith("ref: "):
+        ref = head[len("ref: ") :]
+        branch = ref.removeprefix("refs/heads/")
+        return branch, resolve_ref(common, ref)
+    return None, head
+
+
+def branch_origin(common: Path, branch: str) -> str | None:
+    """The commit a branch was created at, from the first entry of its reflog."""
+    try:
+        with open(common / "logs" / "refs" / "heads" / branch, encoding="utf-8") as log:
+            fields = log.readline().split(" ", 2)
+    except (OSError, UnicodeDecodeError):
+        return None
+    return fields[1] if len(fields) > 2 else None
+
+
+def worktree_activity(worktree: Path) -> float | None:
+    """When a linked worktree was last checked out, staged in or committed to."""
+    admin = linked_gitdir(worktree)
+    if admin is None:
+        return None
+    stamps = []
+    for name in ("HEAD", "index", "logs/HEAD"):
+        try:
+            stamps.append((admin / name).stat().st_mtime)
+        except OSError:
+            continue
+    return max(stamps, default=None)
+
+
+def format_age(seconds: float) -> str:
+    for unit, size in (("w", 7 * 24 * 3600), ("d", 24 * 3600), ("h", 3600), ("m", 60)):
+        if seconds >= size:
+            return f"{int(seconds // size)}{unit}"
+    return "now"
+
+
+def format_size(size: float) -> str:
+    for unit in ("B", "K", "M", "G"):
+        if size < 1024:
+            return f"{int(size)}{unit}" if unit == "B" else f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}T"
+
+
+def list_refs(common: Path, prefix: str) -> list[str]:
+    """Names of the loose and packed refs under prefix, with prefix removed."""
+    names: set[str] = set()
+    for directory, _, files in os.walk(common / prefix):
+        relative = Path(directory).relative_to(common).as_posix()
+        names.update(f"{relative}/{name}" for name in files)
+    packed = read_text_file(common / "packed-refs") or ""
+    for line in packed.splitlines():
+        _, _, name = line.partition(" ")
+        if not line.startswith(("#", "^")) and name.startswith(prefix):
+            names.add(name)
+    return sorted(name.removeprefix(prefix) for name in names if not name.endswith("/HEAD"))
+
+
+def read_worktrees(common: Path) -> list[Worktree] | None:
+    """Build the `git worktree list` records for a common gitdir in-process.
+
+    Returns None for anything outside the plain layout (a non-worktree
+    PROJECT/.git, bare or core.worktree configs, reftable refs) so callers can
+    fall back to asking git.
+    """
+    if common.name != ".git" or (common / "reftable").exists():
+        return None
+    config = read_text_file(common / "config")
+    if config is None:
+        return None
+    section = ""
+    for raw_line in config.splitlines():
+        line = raw_line.strip().lower()
+        if line.startswith("["):
+            section = line
+        elif section == "[core]" and (
+            line.replace(" ", "") == "bare=true" or line.startswith("worktree")
+        ):
+            return None
+    primary_path = common.parent
+    if (primary_path / ".git").resolve(strict=False) != common:
+        return None
+
+    primary_head = read_head(common, common)
+    if primary_head is None:
+        return None
+    records = [
+        Worktree(
+            path=primary_path,
+            branch=primary_head[0],
+            head=primary_head[1],
+            detached=primary_head[0] is None,
+        )
+    ]
+    try:
+        admins = sorted(entry for entry in (common / "worktrees").iterdir() if entry.is_dir())
+    except FileNotFoundError:
+        admins = []
+    except OSError:
+        return None
+    for admin in admins:
+        gitdir = read_text_file(admin / "gitdir")
+        head = read_head(common, admin)
+        if not gitdir or head is None:
+            return None
+        gitdir_path = Path(gitdir)
+        if not gitdir_path.is_absolute():
+            gitdir_path = admin / gitdir_path
+        lock_reason = read_text_file(admin / "locked")
+        records.append(
+            Worktree(
+                path=gitdir_path.parent.resolve(strict=False),
+                branch=head[0],
+                head=head[1],
+                detached=head[0] is None,
+                locked=lock_reason is not None,
+                lock_reason=lock_reason or None,
+            )
+        )
+    return records
+
+
+def write_json(path: Path, payload: object) -> bool:
+    """Atomically replace a state file; wt state is a cache, so failures are soft."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        temporary.write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
+        os.replace(temporary, path)
+    except OSError:
+        return False
+    return True
+
+
+@dataclass(frozen=True)
+class StaleWorktree:
+    """A managed worktree `gc` considers stale, and whether it is safe to remove."""
+
+    project: Path
+    worktree: Worktree
+    reasons: tuple[str, ...]
+    # clean, dirty, missing or locked; only clean ones are removed.
+    status: str
+
+    @property
+    def removable(self) -> bool:
+        return self.status == "clean"
+
+
+class WorktreeIndex:
+    """On-disk map from managed worktree directories to their owning project.
+
+    Only the owner is kept; branch and HEAD change with every checkout and
+    commit and are always read from the worktree itself. Entries are stamped
+    with the mtimes of the worktree's .git file, its administrative directory
+    and the common gitdir's worktrees/ directory, so adding, removing or moving
+    a worktree invalidates them.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.lock = threading.Lock()
+        self._entries: dict[str, dict[str, object]] | None = None
+        self._changed = False
+
+    @staticmethod
+    def stamp(worktree: Path) -> list[int] | None:
+        admin = linked_gitdir(worktree)
+        if admin is None:
+            return None
+        try:
+            return [
+                (worktree / ".git").stat().st_mtime_ns,
+                admin.stat().st_mtime_ns,
+                admin.parent.stat().st_mtime_ns,
+            ]
+        except OSError:
+            return None
+
+    def entries(self) -> dict[str, dict[str, object]]:
+        if self._entries is None:
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                data = {}
+            if not isinstance(data, dict) or data.get("version") != self.VERSION:
+                data = {}
+            worktrees = data.get("worktrees")
+            self._entries = worktrees if isinstance(worktrees, dict) else {}
+        return self._entries
+
+    def lookup(self, path: Path) -> Path | None:
+        """The project owning the worktree at path, if the entry is still current."""
+        key = str(path.resolve(strict=False))
+        with self.lock:
+            entry = self.entries().get(key)
+        if not isinstance(entry, dict) or entry.get("stamp") != self.stamp(Path(key)):
+            return None
+        owner = Path(str(entry.get("owner")))
+        return owner if owner.is_dir() else None
+
+    def record(self, owner: Path, path: Path) -> None:
+        stamp = self.stamp(path)
+        if stamp is None:
+            self.forget(path)
+            return
+        entry: dict[str, object] = {"owner": str(owner), "stamp": stamp}
+        with self.lock:
+            entries = self.entries()
+            if entries.get(str(path)) != entry:
+                entries[str(path)] = entry
+                self._changed = True
+
+    def forget(self, path: Path) -> None:
+        with self.lock:
+            if self.entries().pop(str(path.resolve(strict=False)), None) is not None:
+                self._changed = True
+
+    def save(self) -> None:
+        with self.lock:
+            if not self._changed or self._entries is None:
+                return
+            if write_json(self.path, {"version": self.VERSION, "worktrees": self._entries}):
+                self._changed = False
+
+
+class TimedCache:
+    """Small JSON file of values that expire after a fixed age."""
+
+    def __init__(
+        self, path: Path, ttl: float, clock: Callable[[], float] = time.time
+    ) -> None:
+        self.path = path
+        self.ttl = ttl
+        self.clock = clock
+        self.lock = threading.Lock()
+
+    def load(self) -> dict[str, dict[str, object]]:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def get(self, key: str) -> object | None:
+        with self.lock:
+            entry = self.load().get(key)
+        if not isinstance(entry, dict):
+            return None
+        stored = entry.get("at")
+        if not isinstance(stored, (int, float)) or not 0 <= self.clock() - stored < self.ttl:
+            return None
+        return entry.get("value")
+
+    def put(self, key: str, value: object) -> None:
+        with self.lock:
+            data = self.load()
+            data[key] = {"value": value, "at": self.clock()}
+            write_json(self.path, data)
+
+
+class CompletionSnapshot:
+    """Projects and branches that `wt __complete` offers without running git.
+
+    Commands record what they already learned (discovered projects, managed
+    worktrees, origin branches read from the refs on disk) and the snapshot is
+    written once at the end.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.lock = threading.Lock()
+        self._data: dict[str, Any] | None = None
+        self._changed = False
+
+    def data(self) -> dict[str, Any]:
+        if self._data is None:
+            self._data = wt_complete.load_snapshot(str(self.path))
+            self._data.setdefault("searches", {})
+            self._data.setdefault("projects", {})
+        return self._data
+
+    def record_search(self, cwd: Path, projects: list[Path]) -> None:
+        with self.lock:
+            self.data()["searches"][str(cwd)] = [str(project) for project in projects]
+            self._changed = True
+
+    @staticmethod
+    def origin_branches(project: Path) -> list[str]:
+        common = common_gitdir(project)
+        return list_refs(common, "refs/remotes/origin/") if common is not None else []
+
+    def record_project(self, project: Path, managed: list[Worktree]) -> None:
+        bases = self.origin_branches(project)
+        branches = [worktree.branch for worktree in managed if worktree.branch]
+        with self.lock:
+            self.data()["projects"][str(project)] = {"managed": branches, "bases": bases}
+            self._changed = True
+
+    def update_branches(
+        self, project: Path, *, add: Iterable[str] = (), remove: Iterable[str] = ()
+    ) -> None:
+        bases = self.origin_branches(project)
+        with self.lock:
+            entry = self.data()["projects"].setdefault(str(project), {})
+            removed = set(remove)
+            kept = [branch for branch in entry.get("managed", []) if branch not in removed]
+            entry.update(managed=list(dict.fromkeys([*kept, *add])), bases=bases)
+            self._changed = True
+
+    def save(self) -> None:
+        with self.lock:
+            if not self._changed:
+                return
+            payload = {**self.data(), "version": wt_complete.SNAPSHOT_VERSION}
+            if write_json(self.path, payload):
+                self._changed = False
+
+
+class Seeder:
+    """Copies build directories into a new worktree as cheaply as the filesystem allows.
+
+    Each file is cloned with FICLONE (copy-on-write), else hard-linked, else
+    copied. Once a cheaper method fails for a reason that holds for the whole
+    tree (other filesystem, no reflink support), it is not tried again.
+    Directories are walked level by level, each level concurrently.
+    """
+
+    METHODS = ("reflink", "hardlink", "copy")
+    REFLINK_UNSUPPORTED = {errno.EXDEV, errno.EOPNOTSUPP, errno.ENOTTY, errno.EINVAL, errno.ENOSYS}
+    HARDLINK_UNSUPPORTED = {errno.EXDEV, errno.EPERM, errno.EMLINK}
+
+    def __init__(
+        self, map_concurrently: Callable[[Callable[[Path], list[Path]], list[Path]], list[Any]]
+    ) -> None:
+        self.map_concurrently = map_concurrently
+        self.method = 0
+        self.counts = dict.fromkeys(self.METHODS, 0)
+        self.lock = threading.Lock()
+
+    def seed(self, source: Path, destination: Path) -> bool:
+        """Mirror source at destination unless destination already exists."""
+        if not source.is_dir() or destination.exists() or destination.is_symlink():
+            return False
+        level = [Path()]
+        while level:
+            nested = self.map_concurrently(
+                lambda relative: self.copy_directory(source, destination, relative), level
+            )
+            level = [child for children in nested for child in children]
+        return True
+
+    def copy_directory(self, source: Path, destination: Path, relative: Path) -> list[Path]:
+        target = destination / relative
+        target.mkdir(parents=True, exist_ok=True)
+        shutil.copymode(source / relative, target)
+        children: list[Path] = []
+        with os.scandir(source / relative) as entries:
+            for entry in entries:
+                path = relative / entry.name
+                if entry.is_symlink():
+                    os.symlink(os.readlink(entry.path), destination / path)
+                elif entry.is_dir():
+                    children.append(path)
+                elif entry.is_file():
+                    self.copy_file(Path(entry.path), destination / path)
+        return children
+
+    def copy_file(self, source: Path, target: Path) -> None:
+        if self.method == 0:
+            try:
+                self.reflink(source, target)
+                return self.count("reflink")
+            except OSError as exc:
+                target.unlink(missing_ok=True)
+                if exc.errno not in self.REFLINK_UNSUPPORTED:
+                    raise
+                self.method = max(self.method, 1)
+        if self.method == 1:
+            try:
+                os.link(source, target)
+                return self.count("hardlink")
+            except OSError as exc:
+                if exc.errno not in self.HARDLINK_UNSUPPORTED:
+                    raise
+                self.method = 2
+        shutil.copy2(source, target)
+        self.count("copy")
+
+    @staticmethod
+    def reflink(source: Path, target: Path) -> None:
+        with open(source, "rb") as original, open(target, "xb") as clone:
+            fcntl.ioctl(clone.fileno(), FICLONE, original.fileno())
+        # Build tools compare mtimes, so the clone must look as old as the original.
+        shutil.copystat(source, target)
+
+    def count(self, method: str) -> None:
+        with self.lock:
+            self.counts[method] += 1
+
+
+@dataclass
+class UsageTotals:
+    """Apparent and allocated bytes, counting each hardlinked inode and shared extent once."""
+
+    apparent: int = 0
+    disk: int = 0
+    seen: set[tuple[int, int, int]] = field(default_factory=set, repr=False)
+
+    def add(self, scan: dict[str, Any]) -> None:
+        self.apparent += scan["apparent"]
+        self.disk += scan["disk"]
+        for device, inode, size, blocks in scan["linked"]:
+            if self.first((0, device, inode)):
+                self.apparent += size
+                self.disk += blocks
+        for device, physical, length in scan["shared"]:
+            if self.first((1, device, physical)):
+                self.disk += length
+
+    def first(self, key: tuple[int, int, int]) -> bool:
+        if key in self.seen:
+            return False
+        self.seen.add(key)
+        return True
+
+
+class DiskUsage:
+    """Per-directory size scans of managed worktrees, cached by directory mtime.
+
+    Adding, removing or renaming an entry changes its directory's mtime, so a
+    directory whose mtime matches the cache reuses its scan and is not listed
+    again; only its subdirectories are visited. A file rewritten in place keeps
+    its directory's mtime and is re-measured when something else there changes.
+    Hardlinked files and extents shared through reflinks are recorded by
+    identity so UsageTotals counts them once. Levels are scanned concurrently.
+    """
+
+    VERSION = 1
+    FIEMAP_UNSUPPORTED = {errno.EOPNOTSUPP, errno.ENOTTY, errno.EINVAL, errno.ENOSYS}
+    EXTENT_BATCH = 64
+
+    def __init__(
+        self,
+        path: Path,
+        map_concurrently: Callable[
+            [Callable[[str], dict[str, Any] | None], list[str]], list[dict[str, Any] | None]
+        ],
+    ) -> None:
+        self.path = path
+        self.map_concurrently = map_concurrently
+        self.fiemap = True
+        self.measured: dict[str, dict[str, dict[str, Any]]] = {}
+        self._worktrees: dict[str, dict[str, dict[str, Any]]] | None = None
+
+    def worktrees(self) -> dict[str, dict[str, dict[str, Any]]]:
+        if self._worktrees is None:
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                data = {}
+            if not isinstance(data, dict) or data.get("version") != self.VERSION:
+                data = {}
+            worktrees = data.get("worktrees")
+            self._worktrees = worktrees if isinstance(worktrees, dict) else {}
+        return self._worktrees
+
+    def measure(self, root: Path, *totals: UsageTotals) -> None:
+        cached = self.worktrees().get(str(root))
+        previous = cached if isinstance(cached, dict) else {}
+        scans: dict[str, dict[str, Any]] = {}
+        level = [""]
+        while level:
+            found = self.map_concurrently(
+                lambda relative: self.scan(root, relative, previous.get(relative)), level
+            )
+            nested: list[str] = []
+            for relative, scan in zip(level, found):
+                if scan is None:
+                    continue
+                scans[relative] = scan
+                for total in totals:
+                    total.add(scan)
+                nested.extend(f"{relative}/{name}" if relative else name for name in scan["dirs"])
+            level = nested
+        self.measured[str(root)] = scans
+
+    def scan(self, root: Path, relative: str, cached: object) -> dict[str, Any] | None:
+        directory = root / relative
+        try:
+            info = directory.lstat()
+            if isinstance(cached, dict) and cached.get("mtime") == info.st_mtime_ns:
+                return cached
+            return self.scan_directory(directory, info)
+        except OSError:
+            # Vanished or unreadable while walking; du reports what it could see.
+            return None
+
+    def scan_directory(self, directory: Path, info: os.stat_result) -> dict[str, Any]:
+        scan: dict[str, Any] = {
+            "mtime": info.st_mtime_ns,
+            "dirs": [],
+            "apparent": info.st_size,
+            "disk": info.st_blocks * 512,
+            "linked": [],
+            "shared": [],
+        }
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    scan["dirs"].append(entry.name)
+                    continue
+                stat = entry.stat(follow_symlinks=False)
+                blocks = stat.st_blocks * 512
+                if stat.st_nlink > 1:
+                    scan["linked"].append([stat.st_dev, stat.st_ino, stat.st_size, blocks])
+                    continue
+                shared = []
+                if blocks and entry.is_file(follow_symlinks=False):
+                    shared = self.shared_extents(entry.path)
+                scan["apparent"] += stat.st_size
+                scan["disk"] += max(0, blocks - sum(length for _, length in shared))
+                scan["shared"].extend([stat.st_dev, *extent] for extent in shared)
+        return scan
+
+    def shared_extents(self, path: str) -> list[tuple[int, int]]:
+        """(physical offset, length) of the file's extents that other files also use."""
+        if not self.fiemap:
+            return []
+        try:
+            with open(path, "rb") as stream:
+                return self.read_extents(stream.fileno())
+        except OSError as exc:
+            if exc.errno in self.FIEMAP_UNSUPPORTED:
+                self.fiemap = False
+            return []
+
+    def read_extents(self, descriptor: int) -> list[tuple[int, int]]:
+        shared: list[tuple[int, int]] = []
+        start = 0
+        while True:
+            request = bytearray(
+                FIEMAP_HEADER.pack(start, 2**64 - 1 - start, 0, 0, self.EXTENT_BATCH, 0)
+            )
+            request += bytes(FIEMAP_EXTENT.size * self.EXTENT_BATCH)
+            fcntl.ioctl(descriptor, FIEMAP, request)
+            mapped = FIEMAP_HEADER.unpack_from(request)[3]
+            last = False
+            for index in range(mapped):
+                offset = FIEMAP_HEADER.size + FIEMAP_EXTENT.size * index
+                logical, physical, length, _, _, flags, *_ = FIEMAP_EXTENT.unpack_from(
+                    request, offset
+                )
+                if flags & FIEMAP_EXTENT_SHARED:
+                    shared.append((physical, length))
+                start = logical + length
+                last = bool(flags & FIEMAP_EXTENT_LAST)
+            if last or mapped < self.EXTENT_BATCH:
+                return shared
+
+    def save(self, *, prune: bool = False) -> None:
+        """Store this run's scans; prune drops worktrees that were not measured."""
+        worktrees = {} if prune else dict(self.worktrees())
+        worktrees.update(self.measured)
+        write_json(self.path, {"version": self.VERSION, "worktrees": worktrees})
+
+
+class SessionIndex:
+    """tmux sessions keyed by their resolved directory.
+
+    Built from one `tmux list-sessions` per command and shared by every removal,
+    so finding the sessions for W worktrees costs one subprocess and a walk up
+    each session's path instead of W listings.
+    """
+
+    def __init__(self, sessions: dict[Path, list[str]] | None = None) -> None:
+        self.sessions = sessions or {}
+
+    @classmethod
+    def parse(cls, output: str) -> SessionIndex:
+        sessions: dict[Path, list[str]] = {}
+        for line in output.splitlines():
+            name, separator, session_path = line.partition("\t")
+            if not separator or not session_path:
+                continue
+            path = Path(session_path).expanduser().resolve(strict=False)
+            sessions.setdefault(path, []).append(name)
+        return cls(sessions)
+
+    def within(self, paths: list[Path]) -> list[str]:
+        """Names of sessions rooted at, or anywhere inside, one of paths."""
+        targets = {path.resolve(strict=False) for path in paths}
+        return [
+            name
+            for session_path, names in self.sessions.items()
+            if session_path in targets or not targets.isdisjoint(session_path.parents)
+            for name in names
+        ]
+
+    def discard(self, names: list[str]) -> None:
+        gone = set(names)
+        for session_path in list(self.sessions):
+            remaining = [name for name in self.sessions[session_path] if name not in gone]
+            if remaining:
+                self.sessions[session_path] = remaining
+            else:
+                del self.sessions[session_path]
 
 
 class ExternalTools:
@@ -84,6 +1228,8 @@ class ExternalTools:
     def __init__(self, runner: Runner, which: Callable[[str], str | None] = shutil.which):
         self.runner = runner
         self.which = which
+        self._sessions: SessionIndex | None = None
+        self._sessions_lock = threading.Lock()
 
     def pick(self, choices: list[str], prompt: str) -> str:
         if not choices:
@@ -101,33 +1247,91 @@ class ExternalTools:
             raise WTError("selection cancelled")
         return selected
 
+    def pick_stream(
+        self,
+        choices: Generator[str, None, None],
+        prompt: str,
+        *,
+        empty: str | None = None,
+        stop: Callable[[], object] | None = None,
+    ) -> str:
+        """Like pick, but fzf opens at once and lists choices as they are produced.
+
+        stop is called once fzf exits, to wake a producer still waiting for work.
+        """
+        if not self.which("fzf"):
+            choices.close()
+            raise WTError("fzf is required for interactive selection")
+        result, offered = self.runner.feed(
+            ["fzf", "--exit-0", "--prompt", f"{prompt}> "], choices, stop=stop
+        )
+        selected = (result.stdout or "").rstrip("\n")
+        if not offered:
+            raise WTError(empty or f"no {prompt.lower()} available")
+        if result.returncode != 0 or not selected:
+            raise WTError("selection cancelled")
+        return selected
+
     def zoxide_add(self, path: Path) -> None:
         if self.which("zoxide"):
             self.runner.run(["zoxide", "add", str(path)], check=False)
 
-    def zoxide_remove(self, path: Path) -> None:
-        if self.which("zoxide"):
-            self.runner.run(["zoxide", "remove", str(path)], check=False)
+    def zoxide_add_all(self, paths: list[Path]) -> None:
+        if paths and self.which("zoxide"):
+            self.runner.run(["zoxide", "add", *map(str, paths)], check=False)
+
+    def zoxide_remove_all(self, paths: list[Path]) -> None:
+        if paths and self.which("zoxide"):
+            self.runner.run(["zoxide", "remove", *map(str, paths)], check=False)
+
+    def refill_pool(self, project: Path) -> None:
+        """Top up the project's worktree pool from a detached `wt pool` process."""
+        self.runner.spawn([sys.executable, str(Path(__file__).resolve()), "pool", str(project)])
 
     def sesh_connect(self, path: Path) -> None:
         if not self.which("sesh"):
             raise WTError("sesh is required to connect to the new worktree")
         self.runner.run(["sesh", "connect", str(path)], capture=False)
 
-    def kill_tmux_at(self, path: Path) -> None:
-        if not self.which("tmux"):
+    def session_index(self) -> SessionIndex:
+        """List tmux sessions on first use; later calls reuse the same index."""
+        with self._sessions_lock:
+            if self._sessions is None:
+                result = self.runner.run(
+                    ["tmux", "list-sessions", "-F", "#{session_name}\t#{session_path}"],
+                    check=False,
+                )
+                self._sessions = SessionIndex.parse(
+                    (result.stdout or "") if result.returncode == 0 else ""
+                )
+            return self._sessions
+
+    def kill_tmux_sessions(self, paths: list[Path]) -> None:
+        """Kill every tmux session rooted at or inside one of paths."""
+        if not paths or not self.which("tmux"):
             return
-        result = self.runner.run(
-            ["tmux", "list-sessions", "-F", "#{session_name}\t#{session_path}"],
-            check=False,
-        )
-        target_path = path.resolve(strict=False)
-        for line in (result.stdout or "").splitlines():
-            name, separator, session_path = line.partition("\t")
-            if not separator or not session_path:
-                continue
-            if Path(session_path).expanduser().resolve(strict=False) == target_path:
-                self.runner.run(["tmux", "kill-session", "-t", name], check=False)
+        index = self.session_index()
+        names = index.within(paths)
+        for name in names:
+            self.runner.run(["tmux", "kill-session", "-t", f"={name}"], check=False)
+        index.discard(names)
+
+
+@dataclass(frozen=True)
+class Command:
+    """A subprocess an operation needs; WorktreeManager.drive decides how it runs."""
+
+    argv: tuple[str, ...]
+    check: bool = True
+    # Only the first line of output matters; the process may be stopped after it.
+    first_line: bool = False
+
+
+# An operation written once for both the CLI and the daemon: a generator that
+# yields a Command (and is sent its result) or a list of Commands and nested
+# operations to run concurrently (and is sent their results), and returns the
+# operation's value.
+Steps = Generator[Any, Any, R]
 
 
 class WorktreeManager:
@@ -137,48 +1341,142 @@ class WorktreeManager:
         root: Path | None = None,
         cwd: Path | None = None,
         runner: Runner | None = None,
+        async_runner: AsyncRunner | None = None,
         tools: ExternalTools | None = None,
         input_fn: Callable[[str], str] = input,
         stdout: TextIO = sys.stdout,
+        jobs: int = DEFAULT_JOBS,
+        dirty_mode: str = DEFAULT_DIRTY_MODE,
+        discovery_depth: int = 1,
+        discovery_ignore: Iterable[str] = DEFAULT_DISCOVERY_IGNORE,
+        fetch_ttl: float = DEFAULT_FETCH_TTL,
     ) -> None:
         self.root = (root or Path.home() / ".worktrees").expanduser().resolve(strict=False)
+        # Dot-directories under the managed root hold wt's own state, never worktrees.
+        self.state_dir = self.root / ".wt"
+        self.index = WorktreeIndex(self.state_dir / "index.json")
+        self.default_branches = TimedCache(
+            self.state_dir / "default-branches.json", DEFAULT_BRANCH_TTL
+        )
+        self.fetches = TimedCache(self.state_dir / "fetches.json", fetch_ttl)
+        self.daemon_socket = self.state_dir / "daemon.sock"
+        self.git_features = TimedCache(self.state_dir / "git-features.json", GIT_FEATURE_TTL)
+        self._ahead_behind: bool | None = None
+        self.completions = CompletionSnapshot(self.state_dir / wt_complete.SNAPSHOT_NAME)
         self.cwd = (cwd or Path.cwd()).resolve()
         self.runner = runner or Runner()
         self.tools = tools or ExternalTools(self.runner)
         self.input = input_fn
         self.stdout = stdout
+        self.jobs = max(1, jobs)
+        if dirty_mode not in DIRTY_MODES:
+            raise WTError(f"unknown dirty check mode: {dirty_mode}")
+        self.dirty_mode = dirty_mode
+        self.discovery_depth = max(0, discovery_depth)
+        self.discovery_ignore = frozenset(discovery_ignore)
+        # An injected synchronous runner stays the only subprocess boundary: the
+        # async variants then run it on worker threads instead of spawning directly.
+        if async_runner is None and runner is None:
+            async_runner = AsyncRunner(self.jobs)
+        self.async_runner = async_runner
+
+    def map_concurrently(self, function: Callable[[T], R], items: Iterable[T]) -> list[R]:
+        """Apply function on a bounded worker pool, preserving input order."""
+        pending = list(items)
+        if self.jobs == 1 or len(pending) < 2:
+            return [function(item) for item in pending]
+        with ThreadPoolExecutor(max_workers=min(self.jobs, len(pending))) as pool:
+            return list(pool.map(function, pending))
 
     def git(
         self, project: Path, *arguments: str, check: bool = True
     ) -> subprocess.CompletedProcess[str]:
         return self.runner.run(["git", "-C", str(project), *arguments], check=check)
 
-    def validate_project(self, path: Path) -> Path:
+    @staticmethod
+    def git_command(project: Path, *arguments: str, check: bool = True) -> Command:
+        return Command(("git", "-C", str(project), *arguments), check)
+
+    def drive(self, steps: Steps[R]) -> R:
+        """Run an operation's commands with the synchronous runner."""
+        value: Any = None
+        error: WTError | None = None
+        with contextlib.closing(steps):
+            while True:
+                try:
+                    request = steps.throw(error) if error is not None else steps.send(value)
+                except StopIteration as done:
+                    return done.value
+                value, error = None, None
+                try:
+                    if isinstance(request, list):
+                        value = self.map_concurrently(self.execute, request)
+                    else:
+                        value = self.execute(request)
+                except WTError as exc:
+                    error = exc
+
+    def execute(self, request: Command | Steps[Any]) -> Any:
+        if not isinstance(request, Command):
+            return self.drive(request)
+        if request.first_line:
+            return self.runner.first_line(list(request.argv))
+        return self.runner.run(list(request.argv), check=request.check)
+
+    @staticmethod
+    def optional(steps: Steps[R]) -> Steps[R | None]:
+        """The operation's value, or None when it fails with a WTError."""
+        try:
+            return (yield from steps)
+        except WTError:
+            return None
+
+    def project_candidate(self, path: Path) -> tuple[Path, list[Worktree] | None]:
+        """Normalize a project path and read its worktrees in-process when possible."""
         candidate = path.expanduser()
         if not candidate.is_absolute():
             candidate = self.cwd / candidate
         candidate = candidate.resolve(strict=False)
         if not candidate.exists() or not candidate.is_dir():
             raise WTError(f"project does not exist: {candidate}")
+        common = common_gitdir(candidate)
+        return candidate, read_worktrees(common) if common is not None else None
 
-        bare = self.git(candidate, "rev-parse", "--is-bare-repository", check=False)
+    def validate_project(self, path: Path) -> Path:
+        return self.drive(self.validate_project_steps(path))
+
+    def validate_project_steps(self, path: Path) -> Steps[Path]:
+        candidate, worktrees = self.project_candidate(path)
+        if worktrees:
+            return worktrees[0].path
+
+        bare = yield self.git_command(
+            candidate, "rev-parse", "--is-bare-repository", check=False
+        )
         if bare.returncode != 0:
             raise WTError(f"not a Git project: {candidate}")
         if bare.stdout.strip() == "true":
             raise WTError(f"bare repositories are not supported: {candidate}")
-        top = self.git(candidate, "rev-parse", "--show-toplevel", check=False)
+        top = yield self.git_command(candidate, "rev-parse", "--show-toplevel", check=False)
         if top.returncode != 0 or not (top.stdout or "").strip():
             raise WTError(f"not a Git project: {candidate}")
         top_path = Path((top.stdout or "").strip()).resolve()
 
-        listing = self.git(top_path, "worktree", "list", "--porcelain", check=False)
+        listing = yield self.git_command(top_path, "worktree", "list", "--porcelain", check=False)
         if listing.returncode != 0:
             raise WTError(f"cannot inspect Git worktrees for: {candidate}")
         worktrees = self.parse_worktrees(listing.stdout or "")
         return worktrees[0].path if worktrees else top_path
 
     def owner_for_worktree(self, path: Path) -> Path:
-        result = self.git(path, "worktree", "list", "--porcelain", check=False)
+        return self.drive(self.owner_steps(path))
+
+    def owner_steps(self, path: Path) -> Steps[Path]:
+        common = common_gitdir(path)
+        worktrees = read_worktrees(common) if common is not None else None
+        if worktrees:
+            return worktrees[0].path
+        result = yield self.git_command(path, "worktree", "list", "--porcelain", check=False)
         if result.returncode != 0:
             raise WTError(f"not a linked Git worktree: {path}")
         worktrees = self.parse_worktrees(result.stdout)
@@ -186,7 +1484,7 @@ class WorktreeManager:
             raise WTError(f"cannot determine project owner for: {path}")
         # Git lists the primary worktree first; this is authoritative even when
         # the common Git directory lives somewhere other than PROJECT/.git.
-        return self.validate_project(worktrees[0].path)
+        return (yield from self.validate_project_steps(worktrees[0].path))
 
     @staticmethod
     def parse_worktrees(output: str) -> list[Worktree]:
@@ -227,53 +1525,157 @@ class WorktreeManager:
         return records
 
     def worktrees_for(self, project: Path) -> list[Worktree]:
-        result = self.git(project, "worktree", "list", "--porcelain")
+        return self.drive(self.worktrees_steps(project))
+
+    def worktrees_steps(self, project: Path) -> Steps[list[Worktree]]:
+        common = common_gitdir(project)
+        worktrees = read_worktrees(common) if common is not None else None
+        if worktrees:
+            return worktrees
+        result = yield self.git_command(project, "worktree", "list", "--porcelain")
         return self.parse_worktrees(result.stdout)
 
     def is_managed_path(self, path: Path) -> bool:
         resolved = path.resolve(strict=False)
-        return resolved != self.root and resolved.is_relative_to(self.root)
+        if resolved == self.root or not resolved.is_relative_to(self.root):
+            return False
+        # Dot-directories (state, the worktree pool) are never user worktrees.
+        return not resolved.relative_to(self.root).parts[0].startswith(".")
 
     def managed_for(self, project: Path) -> list[Worktree]:
+        return self.drive(self.managed_steps(project))
+
+    def managed_steps(self, project: Path) -> Steps[list[Worktree]]:
         primary = project.resolve(strict=False)
-        return [
+        managed = [
             worktree
-            for worktree in self.worktrees_for(project)
+            for worktree in (yield from self.worktrees_steps(project))
             if self.is_managed_path(worktree.path)
             and worktree.path != primary
             and not worktree.bare
         ]
+        for worktree in managed:
+            self.index.record(primary, worktree.path)
+        self.index.save()
+        self.completions.record_project(primary, managed)
+        return managed
 
     def managed_projects(self) -> list[Path]:
+        return self.drive(self.managed_projects_steps())
+
+    def managed_projects_steps(self) -> Steps[list[Path]]:
         if not self.root.is_dir():
             return []
         projects: dict[Path, None] = {}
-        for candidate in self.root.iterdir():
-            if not candidate.is_dir():
+        unindexed: list[Path] = []
+        for candidate in sorted(self.root.iterdir()):
+            if candidate.name.startswith(".") or not candidate.is_dir():
                 continue
-            try:
-                owner = self.owner_for_worktree(candidate)
-                if not self.managed_for(owner):
-                    continue
-            except WTError:
-                continue
-            projects[owner] = None
+            owner = self.index.lookup(candidate)
+            if owner is not None:
+                projects[owner] = None
+            else:
+                unindexed.append(candidate)
+
+        owners = yield [self.optional(self.owner_steps(candidate)) for candidate in unindexed]
+        candidates = [
+            owner for owner in dict.fromkeys(owners) if owner is not None and owner not in projects
+        ]
+        listings = yield [self.optional(self.managed_steps(owner)) for owner in candidates]
+        for owner, worktrees in zip(candidates, listings):
+            if worktrees:
+                projects[owner] = None
         return sorted(projects, key=lambda path: (path.name.lower(), str(path)))
 
-    def discover_projects(self) -> list[Path]:
-        candidates = [self.cwd]
+    def discovery_candidates(self) -> list[Path]:
+        """The cwd plus every directory with a .git entry up to discovery_depth below it.
+
+        The cwd is always tried since it may sit inside a project. The walk goes
+        level by level, scanning each level's directories concurrently; it does
+        not descend into repositories, ignored names, symlinks or the managed root.
+        """
         try:
-            candidates.extend(path for path in self.cwd.iterdir() if path.is_dir())
+            found, level = self.scan_for_repositories(self.cwd, strict=True)
         except OSError as exc:
             raise WTError(f"cannot inspect {self.cwd}: {exc}") from exc
-        projects: dict[Path, None] = {}
-        for candidate in candidates:
-            try:
-                project = self.validate_project(candidate)
-            except WTError:
-                continue
-            projects[project] = None
-        return sorted(projects, key=lambda path: (path.name.lower(), str(path)))
+        if self.discovery_depth == 0:
+            found = []
+        for _ in range(1, self.discovery_depth):
+            if not level:
+                break
+            scanned = self.map_concurrently(self.scan_for_repositories, level)
+            level = [child for _, children in scanned for child in children]
+            found.extend(repository for repositories, _ in scanned for repository in repositories)
+        return [self.cwd, *sorted(found)]
+
+    def scan_for_repositories(
+        self, directory: Path, *, strict: bool = False
+    ) -> tuple[list[Path], list[Path]]:
+        """Split a directory's children into repositories and directories to descend into."""
+        repositories: list[Path] = []
+        descend: list[Path] = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name in self.discovery_ignore or not entry.is_dir():
+                        continue
+                    path = Path(entry.path)
+                    if os.path.lexists(os.path.join(entry.path, ".git")):
+                        repositories.append(path)
+                    elif not entry.is_symlink() and path != self.root:
+                        descend.append(path)
+        except OSError:
+            if strict:
+                raise
+        return repositories, descend
+
+    def try_validate_project(self, path: Path) -> Path | None:
+        try:
+            return self.validate_project(path)
+        except WTError:
+            return None
+
+    def stream_project_choices(
+        self, stopped: Future[None] | None = None
+    ) -> Generator[str, None, None]:
+        """Yield discovered projects as soon as each one validates.
+
+        Resolving stopped ends the generator even while it waits for a
+        validation; closing it cancels validations that have not started yet.
+        """
+        candidates = self.discovery_candidates()
+        pool = ThreadPoolExecutor(max_workers=max(1, min(self.jobs, len(candidates))))
+        try:
+            futures = [pool.submit(self.try_validate_project, path) for path in candidates]
+            found: dict[Path, None] = {}
+            remaining = len(futures)
+            completed = as_completed([*futures, *([stopped] if stopped else [])])
+            while remaining:
+                future = next(completed)
+                if future is stopped:
+                    return
+                remaining -= 1
+                project = future.result()
+                if project is not None and project not in found:
+                    found[project] = None
+                    yield str(project)
+            discovered = sorted(found, key=lambda path: (path.name.lower(), str(path)))
+            self.completions.record_search(self.cwd, discovered)
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def discover_projects(self) -> list[Path]:
+        return self.drive(self.discover_steps())
+
+    def discover_steps(self) -> Steps[list[Path]]:
+        results = yield [
+            self.optional(self.validate_project_steps(candidate))
+            for candidate in self.discovery_candidates()
+        ]
+        projects = dict.fromkeys(project for project in results if project is not None)
+        discovered = sorted(projects, key=lambda path: (path.name.lower(), str(path)))
+        self.completions.record_search(self.cwd, discovered)
+        return discovered
 
     def resolve_project(self, value: str, *, managed_only: bool = False) -> Path:
         raw = Path(value).expanduser()
@@ -313,125 +1715,641 @@ class WorktreeManager:
         suffix = "-".join(components[1:] if len(components) > 1 else components)
         return f"{project.name}-{suffix}"
 
-    def default_base_branch(self, project: Path) -> str:
-        result = self.git(project, "ls-remote", "--symref", "origin", "HEAD", check=False)
-        if result.returncode != 0:
-            raise WTError("could not determine origin's default branch; use --base")
-        for line in (result.stdout or "").splitlines():
-            prefix = "ref: refs/heads/"
+    @staticmethod
+    def parse_default_branch(output: str) -> str | None:
+        """Extract the symref target `ls-remote --symref origin HEAD` advertises."""
+        prefix = "ref: refs/heads/"
+        for line in output.splitlines():
             if line.startswith(prefix) and line.endswith("\tHEAD"):
                 branch = line[len(prefix) : -len("\tHEAD")]
                 if branch:
                     return branch
-        raise WTError("origin does not advertise a default branch; use --base")
+        return None
+
+    def local_default_branch(self, project: Path) -> str | None:
+        """Read refs/remotes/origin/HEAD, as set by clone or `git remote set-head`."""
+        prefix = "refs/remotes/origin/"
+        common = common_gitdir(project)
+        if common is not None and not (common / "reftable").exists():
+            target = read_text_file(common / "refs" / "remotes" / "origin" / "HEAD") or ""
+            target = target.removeprefix("ref: ")
+        else:
+            result = self.git(
+                project, "symbolic-ref", "--quiet", f"{prefix}HEAD", check=False
+            )
+            target = (result.stdout or "").strip() if result.returncode == 0 else ""
+        branch = target.removeprefix(prefix) if target.startswith(prefix) else ""
+        return branch or None
+
+    def known_default_branch(self, project: Path) -> str | None:
+        """Resolve origin's default branch without network access, if possible."""
+        branch = self.local_default_branch(project)
+        if branch is None:
+            cached = self.default_branches.get(str(project))
+            branch = cached if isinstance(cached, str) and cached else None
+        return branch
+
+    def remember_default_branch(self, project: Path, branch: str) -> None:
+        self.default_branches.put(str(project), branch)
+        local = self.local_default_branch(project)
+        if local is not None and local != branch:
+            # Keep origin/HEAD in step so the local lookup stays authoritative.
+            self.git(project, "remote", "set-head", "origin", branch, check=False)
+
+    def default_base_branch(self, project: Path, *, refresh: bool = False) -> str:
+        if not refresh:
+            known = self.known_default_branch(project)
+            if known is not None:
+                return known
+        result = self.git(project, "ls-remote", "--symref", "origin", "HEAD", check=False)
+        if result.returncode != 0:
+            raise WTError("could not determine origin's default branch; use --base")
+        branch = self.parse_default_branch(result.stdout or "")
+        if branch is None:
+            raise WTError("origin does not advertise a default branch; use --base")
+        self.remember_default_branch(project, branch)
+        return branch
+
+    @staticmethod
+    def normalize_base(value: str) -> str:
+        base_branch = value.removeprefix("refs/remotes/origin/").removeprefix("origin/")
+        if not base_branch:
+            raise WTError("base branch is required")
+        return base_branch
+
+    def fetch_base(
+        self, project: Path, base_branch: str, fetch: bool | None = None
+    ) -> subprocess.CompletedProcess[str]:
+        """Fetch the base branch unless a recent fetch (or --no-fetch) makes it redundant.
+
+        fetch=True always fetches; None fetches when the freshness record has
+        expired; False never does. A base missing locally is always fetched.
+        """
+        key = f"{project}\t{base_branch}"
+        common = common_gitdir(project)
+        present = (
+            common is not None
+            and resolve_ref(common, f"refs/remotes/origin/{base_branch}") is not None
+        )
+        if present and (fetch is False or (fetch is None and self.fetches.get(key))):
+            return subprocess.CompletedProcess([], 0, "", "")
+        result = self.git(project, "fetch", "origin", base_branch, check=False)
+        if result.returncode == 0:
+            self.fetches.put(key, True)
+        return result
+
+    def choose_project(self, project_value: str | None) -> Path:
+        if project_value is not None:
+            return self.resolve_project(project_value)
+        stopped: Future[None] = Future()
+        selected = self.tools.pick_stream(
+            self.stream_project_choices(stopped),
+            "Project",
+            empty="no Git projects found in the current directory or its children",
+            stop=lambda: stopped.set_result(None),
+        )
+        return Path(selected).resolve()
 
     def new(
         self,
         project_value: str | None,
         branch: str | None,
         base: str | None,
+        *,
+        refresh_default: bool = False,
+        fetch: bool | None = None,
+        sparse: list[str] | None = None,
+        sparse_profile: str | None = None,
+        seed: list[str] | None = None,
+        seed_config: bool = True,
     ) -> Path:
-        if project_value is None:
-            projects = self.discover_projects()
-            if not projects:
-                raise WTError("no Git projects found in the current directory or its children")
-            project = self.pick_project(projects)
-        else:
-            project = self.resolve_project(project_value)
-
+        project = self.choose_project(project_value)
         if branch is None:
             branch = self.input("Branch: ").strip()
         if not branch:
             raise WTError("branch is required")
-        valid = self.git(project, "check-ref-format", "--branch", branch, check=False)
-        if valid.returncode != 0:
-            raise WTError(f"invalid branch name: {branch}")
-
-        selected_base = base or self.default_base_branch(project)
-        base_branch = selected_base.removeprefix("refs/remotes/origin/").removeprefix("origin/")
-        if not base_branch:
-            raise WTError("base branch is required")
-        self.git(project, "fetch", "origin", base_branch)
-
-        local = self.git(
-            project, "show-ref", "--verify", "--quiet", f"refs/heads/{branch}", check=False
+        paths = self.sparse_paths(project, sparse, sparse_profile)
+        seeds = self.seed_paths(project, seed, seed_config)
+        base_ref, [destination] = self.prepare_new(
+            project, [branch], base, refresh_default=refresh_default, fetch=fetch
         )
-        if local.returncode == 0:
-            raise WTError(f"local branch already exists: {branch}")
-        remote = self.git(
-            project,
-            "ls-remote",
-            "--exit-code",
-            "--heads",
-            "origin",
-            f"refs/heads/{branch}",
-            check=False,
+        result = None
+        size = self.pool_size(project) if paths is None else 0
+        if size:
+            result = self.claim_pooled(project, branch, destination, base_ref)
+            if len(list(self.pool_dir(project).glob("*.ready"))) < size:
+                self.tools.refill_pool(project)
+        if result is None:
+            result = self.create_worktree(project, branch, destination, base_ref, paths)
+        if result.returncode != 0:
+            raise command_failed(list(result.args), result.stdout, result.stderr)
+        self.completions.update_branches(project, add=[branch])
+        self.tools.zoxide_add(destination)
+        try:
+            self.seed_worktree(project, destination, seeds)
+            self.tools.sesh_connect(destination)
+        except WTError as exc:
+            raise WTError(f"worktree created at {destination}, but {exc}") from exc
+        return destination
+
+    def new_many(
+        self,
+        project_value: str | None,
+        branches: list[str],
+        base: str | None,
+        *,
+        refresh_default: bool = False,
+        fetch: bool | None = None,
+        sparse: list[str] | None = None,
+        sparse_profile: str | None = None,
+        seed: list[str] | None = None,
+        seed_config: bool = True,
+    ) -> list[Path]:
+        """Create one worktree per branch without connecting a session to any of them.
+
+        Resolution, the origin query and the fetch happen once, every name and
+        destination is checked before anything is created, and the worktrees
+        are then added concurrently.
+        """
+        if not branches:
+            raise WTError("at least one branch is required")
+        duplicates = sorted({branch for branch in branches if branches.count(branch) > 1})
+        if duplicates:
+            raise WTError(f"branch given more than once: {', '.join(duplicates)}")
+        project = self.choose_project(project_value)
+        paths = self.sparse_paths(project, sparse, sparse_profile)
+        seeds = self.seed_paths(project, seed, seed_config)
+        base_ref, destinations = self.prepare_new(
+            project, branches, base, refresh_default=refresh_default, fetch=fetch
+        )
+        # `worktree add` reads every registered worktree's admin directory and
+        # fails on one that is half-written, so registration is sequential; the
+        # checkouts, which do the actual I/O, then run concurrently.
+        registered = [
+            self.add_worktree(project, branch, destination, base_ref, checkout=False)
+            for branch, destination in zip(branches, destinations)
+        ]
+        populated = self.map_concurrently(
+            lambda destination: self.populate_worktree(destination, paths),
+            [
+                destination
+                for result, destination in zip(registered, destinations)
+                if result.returncode == 0
+            ],
+        )
+        checkouts = iter(populated)
+        results = [
+            next(checkouts) if result.returncode == 0 else result for result in registered
+        ]
+        created = [
+            (branch, destination)
+            for branch, destination, result in zip(branches, destinations, results)
+            if result.returncode == 0
+        ]
+        self.completions.update_branches(project, add=[branch for branch, _ in created])
+        self.tools.zoxide_add_all([destination for _, destination in created])
+        failures = [
+            command_failed(list(result.args), result.stdout, result.stderr)
+            for result in results
+            if result.returncode != 0
+        ]
+        for _, destination in created:
+            try:
+                self.seed_worktree(project, destination, seeds)
+            except WTError as exc:
+                failures.append(WTError(f"worktree created at {destination}, but {exc}"))
+            print(destination, file=self.stdout)
+        if len(failures) == 1:
+            raise failures[0]
+        if failures:
+            details = "; ".join(str(failure) for failure in failures)
+            raise WTError(f"failed to create {len(failures)} worktree(s): {details}")
+        return [destination for _, destination in created]
+
+    def seed_paths(self, project: Path, seed: list[str] | None, use_config: bool) -> list[str]:
+        """Directories to seed: --seed values plus the project's wt.seed config."""
+        configured: list[str] = []
+        if use_config:
+            result = self.git(project, "config", "--get-all", "wt.seed", check=False)
+            configured = (result.stdout or "").splitlines() if result.returncode == 0 else []
+        return list(dict.fromkeys([*configured, *(seed or [])]))
+
+    def seed_worktree(self, project: Path, destination: Path, seeds: list[str]) -> Seeder:
+        """Copy the primary worktree's build directories (node_modules, target, ...)."""
+        seeder = Seeder(self.map_concurrently)
+        for relative in seeds:
+            source = project / relative
+            target = destination / relative
+            if not source.resolve(strict=False).is_relative_to(project.resolve(strict=False)):
+                raise WTError(f"seed directory is outside the project: {relative}")
+            try:
+                seeder.seed(source, target)
+            except OSError as exc:
+                raise WTError(f"could not seed {relative}: {exc}") from exc
+        return seeder
+
+    def sparse_paths(
+        self, project: Path, sparse: list[str] | None, profile: str | None
+    ) -> list[str] | None:
+        """Cone directories from --sparse and the project's wt-sparse.<profile>.path config."""
+        if profile is None:
+            return list(sparse) if sparse else None
+        result = self.git(
+            project, "config", "--get-all", f"wt-sparse.{profile}.path", check=False
         )
-        if remote.returncode == 0:
-            raise WTError(f"branch already exists on origin: {branch}")
-        if remote.returncode not in (0, 2):
+        if result.returncode != 0:
+            raise WTError(
+                f"unknown sparse profile: {profile} "
+                f"(add paths with git config --add wt-sparse.{profile}.path DIR)"
+            )
+        return [*(result.stdout or "").splitlines(), *(sparse or [])]
+
+    def add_worktree(
+        self, project: Path, branch: str, destination: Path, base_ref: str, *, checkout: bool
+    ) -> subprocess.CompletedProcess[str]:
+        arguments = ["worktree", "add", "-b", branch, "--no-track"]
+        if not checkout:
+            arguments.append("--no-checkout")
+        with self.worktree_lock(project):
+            return self.git(project, *arguments, str(destination), base_ref, check=False)
+
+    @contextlib.contextmanager
+    def project_lock(self, project: Path, name: str, *, wait: bool = True) -> Iterator[bool]:
+        """flock a per-project state file; yields False if busy and wait is False."""
+        digest = hashlib.sha1(str(project).encode()).hexdigest()[:16]
+        path = self.state_dir / "locks" / f"{digest}.{name}"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a") as handle:
+            try:
+                fcntl.flock(handle, fcntl.LOCK_EX | (0 if wait else fcntl.LOCK_NB))
+            except BlockingIOError:
+                yield False
+                return
+            yield True
+
+    def worktree_lock(self, project: Path) -> contextlib.AbstractContextManager[bool]:
+        """Serialize `worktree add` and `move` between wt processes.
+
+        Concurrent registrations can read each other's half-written admin
+        directories and fail.
+        """
+        return self.project_lock(project, "worktrees")
+
+    def populate_worktree(
+        self, destination: Path, sparse: list[str] | None
+    ) -> subprocess.CompletedProcess[str]:
+        """Check out a worktree added with --no-checkout, limited to sparse cone paths."""
+        if sparse is not None:
+            result = self.git(
+                destination, "sparse-checkout", "set", "--cone", "--", *sparse, check=False
+            )
+            if result.returncode != 0:
+                return result
+        return self.git(destination, "checkout", check=False)
+
+    def create_worktree(
+        self,
+        project: Path,
+        branch: str,
+        destination: Path,
+        base_ref: str,
+        sparse: list[str] | None,
+    ) -> subprocess.CompletedProcess[str]:
+        """Add a worktree; with sparse paths, only those are ever written to disk.
+
+        Sparse settings are per worktree, which makes git turn on
+        extensions.worktreeConfig in the project's shared config.
+        """
+        result = self.add_worktree(
+            project, branch, destination, base_ref, checkout=sparse is None
+        )
+        if result.returncode != 0 or sparse is None:
+            return result
+        return self.populate_worktree(destination, sparse)
+
+    def prepare_new(
+        self,
+        project: Path,
+        branches: list[str],
+        base: str | None,
+        *,
+        refresh_default: bool,
+        fetch: bool | None,
+    ) -> tuple[str, list[Path]]:
+        """Check branches and destinations and fetch the base; return (base ref, destinations)."""
+        branch_refs = [f"refs/heads/{branch}" for branch in branches]
+        if base is not None:
+            base_branch: str | None = self.normalize_base(base)
+        elif not refresh_default:
+            known = self.known_default_branch(project)
+            base_branch = self.normalize_base(known) if known is not None else None
+        else:
+            base_branch = None
+
+        # One ls-remote answers both "do the branches exist on origin" and, when
+        # no base was given, "what is origin's default branch"; it runs alongside
+        # the local checks and, when the base is already known, the fetch.
+        if base_branch is None:
+            remote_query = ["ls-remote", "--symref", "origin", "HEAD", *branch_refs]
+        else:
+            remote_query = ["ls-remote", "origin", *branch_refs]
+        preflight: list[Callable[[], subprocess.CompletedProcess[str]]] = [
+            *(
+                lambda name=branch: self.git(
+                    project, "check-ref-format", "--branch", name, check=False
+                )
+                for branch in branches
+            ),
+            lambda: self.git(
+                project, "for-each-ref", "--format=%(refname)", *branch_refs, check=False
+            ),
+            lambda: self.git(project, *remote_query, check=False),
+        ]
+        if base_branch is not None:
+            known_base = base_branch
+            preflight.append(lambda: self.fetch_base(project, known_base, fetch))
+        results = self.map_concurrently(lambda call: call(), preflight)
+        valid = results[: len(branches)]
+        local, remote, *fetched = results[len(branches) :]
+        advertised: str | None = None
+
+        for branch, check in zip(branches, valid):
+            if check.returncode != 0:
+                raise WTError(f"invalid branch name: {branch}")
+        if base_branch is None:
+            if remote.returncode != 0:
+                raise WTError("could not determine origin's default branch; use --base")
+            advertised = self.parse_default_branch(remote.stdout or "")
+            if advertised is None:
+                raise WTError("origin does not advertise a default branch; use --base")
+            base_branch = self.normalize_base(advertised)
+            fetched = [self.fetch_base(project, base_branch, fetch)]
+        if fetched[0].returncode != 0:
+            detail = (fetched[0].stderr or "").strip()
+            message = f"could not fetch {base_branch} from origin"
+            raise WTError(f"{message}: {detail}" if detail else message)
+        if advertised is not None:
+            # Recorded after the fetch so origin/HEAD can point at a real ref.
+            self.remember_default_branch(project, advertised)
+
+        if local.returncode != 0:
+            raise WTError("could not check local branches")
+        local_refs = set((local.stdout or "").splitlines())
+        for branch, branch_ref in zip(branches, branch_refs):
+            if branch_ref in local_refs:
+                raise WTError(f"local branch already exists: {branch}")
+        if remote.returncode != 0:
             raise WTError("could not check target branch on origin")
+        remote_refs = {line.partition("\t")[2] for line in (remote.stdout or "").splitlines()}
+        for branch, branch_ref in zip(branches, branch_refs):
+            if branch_ref in remote_refs:
+                raise WTError(f"branch already exists on origin: {branch}")
 
         base_ref = f"origin/{base_branch}"
         exists = self.git(project, "rev-parse", "--verify", "--quiet", base_ref, check=False)
         if exists.returncode != 0:
             raise WTError(f"base branch not found on origin: {base_branch}")
 
-        destination = self.root / self.destination_name(project, branch)
-        if destination.exists() or destination.is_symlink() or any(
-            item.path == destination.resolve(strict=False) for item in self.worktrees_for(project)
-        ):
-            raise WTError(f"worktree destination already exists: {destination}")
-
+        destinations = [self.root / self.destination_name(project, branch) for branch in branches]
+        claimed: dict[Path, str] = {}
+        registered = {item.path for item in self.worktrees_for(project)}
+        for branch, destination in zip(branches, destinations):
+            if destination in claimed:
+                raise WTError(
+                    f"branches {claimed[destination]} and {branch} "
+                    f"would share a worktree: {destination}"
+                )
+            claimed[destination] = branch
+            if (
+                destination.exists()
+                or destination.is_symlink()
+                or destination.resolve(strict=False) in registered
+            ):
+                raise WTError(f"worktree destination already exists: {destination}")
         self.root.mkdir(parents=True, exist_ok=True)
-        self.git(
-            project,
-            "worktree",
-            "add",
-            "-b",
-            branch,
-            "--no-track",
-            str(destination),
-            base_ref,
-        )
-        self.tools.zoxide_add(destination)
+        return base_ref, destinations
+
+    def pool_dir(self, project: Path) -> Path:
+        digest = hashlib.sha1(str(project).encode()).hexdigest()[:8]
+        return self.root / ".pool" / f"{project.name}-{digest}"
+
+    def pool_sizes(self) -> dict[str, int]:
         try:
-            self.tools.sesh_connect(destination)
-        except WTError as exc:
-            raise WTError(f"worktree created at {destination}, but {exc}") from exc
-        return destination
+            sizes = json.loads((self.state_dir / "pool.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return sizes if isinstance(sizes, dict) else {}
+
+    def pool_size(self, project: Path) -> int:
+        size = self.pool_sizes().get(str(project), 0)
+        return min(size, MAX_POOL_SIZE) if isinstance(size, int) else 0
+
+    def claim_pooled(
+        self, project: Path, branch: str, destination: Path, base_ref: str
+    ) -> subprocess.CompletedProcess[str] | None:
+        """Move a ready pool slot to destination and switch it to a new branch at base_ref.
+
+        Slots are detached checkouts of the base from when they were filled, so
+        the checkout only rewrites what changed since. Renaming the slot's
+        .ready marker is the claim, so concurrent commands never share a slot.
+        Returns None when no slot could be used.
+        """
+        for marker in sorted(self.pool_dir(project).glob("*.ready")):
+            slot = marker.with_suffix("")
+            claimed = marker.with_suffix(".claimed")
+            if not self.claim_slot(slot):
+                continue
+            try:
+                with self.worktree_lock(project):
+                    moved = self.git(
+                        project, "worktree", "move", str(slot), str(destination), check=False
+                    )
+            finally:
+                claimed.unlink(missing_ok=True)
+            if moved.returncode != 0:
+                continue
+            switched = self.git(
+                destination,
+                "checkout",
+                "--quiet",
+                "-b",
+                branch,
+                "--no-track",
+                base_ref,
+                check=False,
+            )
+            if switched.returncode == 0:
+                return switched
+            self.git(project, "worktree", "remove", "--force", str(destination), check=False)
+            return None
+        return None
 
-    def is_dirty(self, worktree: Worktree) -> bool:
+    @staticmethod
+    def claim_slot(slot: Path) -> bool:
+        """Take a ready pool slot for this process; False when someone else has it."""
+        try:
+            os.rename(slot.with_suffix(".ready"), slot.with_suffix(".claimed"))
+        except OSError:
+            return False
+        return True
+
+    def fill_pool(self, project: Path) -> list[Path]:
+        """Bring the project's pool to its configured size; returns the ready slots.
+
+        Only one filler runs per project. Slots are registered under the
+        worktree lock but checked out outside it, and marked ready only once
+        populated; unmarked slots left by an interrupted fill are removed.
+        A claimed slot is left alone: its `new` is waiting for the worktree
+        lock to move it out of the pool.
+        """
+        directory = self.pool_dir(project)
+        with self.project_lock(project, "pool", wait=False) as acquired:
+            if not acquired:
+                return []
+            size = self.pool_size(project)
+            with self.worktree_lock(project):
+                slots = [
+                    worktree.path
+                    for worktree in self.worktrees_for(project)
+                    if worktree.path.parent == directory
+                ]
+                # .ready is renamed to .claimed atomically, so check in that order.
+                ready = [slot for slot in slots if slot.with_suffix(".ready").exists()]
+                leftovers = [
+                    slot
+                    for slot in slots
+                    if slot not in ready and not slot.with_suffix(".claimed").exists()
+                ]
+                surplus = [slot for slot in ready[size:] if self.claim_slot(slot)]
+                for slot in [*leftovers, *surplus]:
+                    self.git(project, "worktree", "remove", "--force", str(slot), check=False)
+                    slot.with_suffix(".claimed").unlink(missing_ok=True)
+            ready = ready[:size]
+            base = self.known_default_branch(project)
+            while base is not None and len(ready) < size:
+                slot = directory / str(time.time_ns())
+                with self.worktree_lock(project):
+                    added = self.git(
+                        project,
+                        "worktree",
+                        "add",
+                        "--detach",
+                        "--no-checkout",
+                        str(slot),
+                        f"origin/{base}",
+                        check=False,
+                    )
+                if added.returncode != 0:
+                    break
+                if self.populate_worktree(slot, None).returncode != 0:
+                    self.git(project, "worktree", "remove", "--force", str(slot), check=False)
+                    break
+                slot.with_suffix(".ready").touch()
+                ready.append(slot)
+        return ready
+
+    def pool(self, project_value: str, *, size: int | None = None) -> list[Path]:
+        """`wt pool`: optionally set the pool size, then fill or trim the pool to it."""
+        project = self.resolve_project(project_value)
+        if size is not None:
+            if not 0 <= size <= MAX_POOL_SIZE:
+                raise WTError(f"pool size must be between 0 and {MAX_POOL_SIZE}")
+            sizes = self.pool_sizes()
+            sizes[str(project)] = size
+            write_json(self.state_dir / "pool.json", sizes)
+        return self.fill_pool(project)
+
+    def is_dirty(self, worktree: Worktree, mode: str | None = None) -> bool:
+        return self.drive(self.dirty_steps(worktree, mode))
+
+    def dirty_steps(self, worktree: Worktree, mode: str | None = None) -> Steps[bool]:
         if not worktree.path.is_dir():
             return False
-        result = self.git(
-            worktree.path,
+        line, returncode = yield Command(tuple(self.dirty_command(worktree, mode)), first_line=True)
+        return bool(line.strip()) or returncode not in (None, 0)
+
+    def dirty_command(self, worktree: Worktree, mode: str | None = None) -> list[str]:
+        return [
+            "git",
+            "--no-optional-locks",
+            "-C",
+            str(worktree.path),
             "status",
             "--porcelain",
-            "--ignored",
-            check=False,
-        )
-        return result.returncode != 0 or bool((result.stdout or "").strip())
+            "--no-renames",
+            *DIRTY_MODES[mode or self.dirty_mode],
+        ]
 
-    def remove_one(self, project: Path, worktree: Worktree, *, force: bool) -> None:
+    def check_removable(self, worktree: Worktree, *, force: bool) -> None:
         if not self.is_managed_path(worktree.path):
             raise WTError(f"refusing to remove unmanaged worktree: {worktree.path}")
         if worktree.locked and not force:
             reason = f": {worktree.lock_reason}" if worktree.lock_reason else ""
             raise WTError(f"worktree is locked{reason} (use --force): {worktree.path}")
-        if self.is_dirty(worktree) and not force:
-            raise WTError(f"worktree is dirty (use --force): {worktree.path}")
 
-        self.tools.kill_tmux_at(worktree.path)
-        self.tools.zoxide_remove(worktree.path)
+    @staticmethod
+    def removal_arguments(worktree: Worktree, *, force: bool) -> list[str]:
         arguments = ["worktree", "remove"]
         if force:
             arguments.append("--force")
             if worktree.locked:
                 arguments.append("--force")
         arguments.append(str(worktree.path))
-        self.git(project, *arguments)
-        self.git(project, "worktree", "prune")
+        return arguments
+
+    def remove_one(self, project: Path, worktree: Worktree, *, force: bool) -> None:
+        self.check_removable(worktree, force=force)
+        if self.is_dirty(worktree) and not force:
+            raise WTError(f"worktree is dirty (use --force): {worktree.path}")
+
+        self.remove_many(project, [worktree], force=force)
+
+    def remove_many(self, project: Path, worktrees: list[Worktree], *, force: bool) -> None:
+        """Remove already-checked worktrees of one project as a batch.
+
+        Integrations are cleaned up with one tmux listing and one zoxide call,
+        removals run concurrently, and the project is pruned once at the end.
+        """
+        self.forget_integrations(worktrees)
+        self.drive(self.removal_steps(project, worktrees, force=force))
+
+    def forget_integrations(self, worktrees: list[Worktree]) -> None:
+        paths = [worktree.path for worktree in worktrees]
+        self.tools.kill_tmux_sessions(paths)
+        self.tools.zoxide_remove_all(paths)
+
+    def removal_steps(
+        self, project: Path, worktrees: list[Worktree], *, force: bool
+    ) -> Steps[None]:
+        results = yield [
+            self.git_command(project, *self.removal_arguments(worktree, force=force), check=False)
+            for worktree in worktrees
+        ]
+        try:
+            yield self.git_command(project, "worktree", "prune")
+        finally:
+            self.finish_removals(project, worktrees, results)
+
+    def finish_removals(
+        self,
+        project: Path,
+        worktrees: list[Worktree],
+        results: list[subprocess.CompletedProcess[str]],
+    ) -> None:
+        failures: list[WTError] = []
+        for worktree, result in zip(worktrees, results):
+            if result.returncode == 0:
+                self.index.forget(worktree.path)
+                if worktree.branch:
+                    self.completions.update_branches(project, remove=[worktree.branch])
+            else:
+                failures.append(command_failed(list(result.args), result.stdout, result.stderr))
+        self.index.save()
+        if len(failures) == 1:
+            raise failures[0]
+        if failures:
+            details = "; ".join(str(failure) for failure in failures)
+            raise WTError(f"failed to remove {len(failures)} worktree(s): {details}")
 
     def delete(
         self, project_value: str | None, branch: str | None, *, force: bool
@@ -462,17 +2380,45 @@ class WorktreeManager:
 
     def clean(self, project_value: str, *, force: bool, yes: bool) -> list[Worktree]:
         project = self.resolve_project(project_value)
-        worktrees = self.managed_for(project)
+        worktrees = self.drive(self.clean_steps(project, force=force, yes=yes))
+        if worktrees:
+            # Everything was preflighted; no deletion starts before all are safe.
+            self.remove_many(project, worktrees, force=force)
+        return worktrees
+
+    def clean_steps(self, project: Path, *, force: bool, yes: bool) -> Steps[list[Worktree]]:
+        """Check and confirm that every managed worktree of project can be removed."""
+        worktrees = yield from self.managed_steps(project)
         if not worktrees:
             print(f"No managed worktrees for {project.name}.", file=self.stdout)
             return []
 
+        self.check_no_locked(worktrees, force=force)
+        for worktree in worktrees:
+            self.check_removable(worktree, force=force)
+        dirty: list[Worktree] = []
+        if not force:
+            flags = yield [self.dirty_steps(worktree) for worktree in worktrees]
+            dirty = [worktree for worktree, flag in zip(worktrees, flags) if flag]
+        self.confirm_clean(project, worktrees, dirty, force=force, yes=yes)
+        return worktrees
+
+    @staticmethod
+    def check_no_locked(worktrees: list[Worktree], *, force: bool) -> None:
         locked = [worktree for worktree in worktrees if worktree.locked]
         if locked and not force:
             paths = ", ".join(str(worktree.path) for worktree in locked)
             raise WTError(f"locked worktrees found; nothing removed (use --force): {paths}")
 
-        dirty = [worktree for worktree in worktrees if self.is_dirty(worktree)]
+    def confirm_clean(
+        self,
+        project: Path,
+        worktrees: list[Worktree],
+        dirty: list[Worktree],
+        *,
+        force: bool,
+        yes: bool,
+    ) -> None:
         if dirty and not force:
             paths = ", ".join(str(worktree.path) for worktree in dirty)
             raise WTError(f"dirty worktrees found; nothing removed (use --force): {paths}")
@@ -484,93 +2430,1331 @@ class WorktreeManager:
             if answer not in {"y", "yes"}:
                 raise WTError("clean cancelled")
 
-        # Dirty state was preflighted above; no deletion starts before all are safe.
+    def stale_arguments(self, base: str) -> list[str]:
+        """One for-each-ref giving each branch's tip, upstream state and merge state."""
+        fields = ["%(refname)", "%(objectname)", "%(upstream)", "%(upstream:track)"]
+        if self.supports_ahead_behind():
+            fields.append(f"%(ahead-behind:refs/remotes/origin/{base})")
+        return ["for-each-ref", f"--format={'%00'.join(fields)}", "refs/heads/"]
+
+    @staticmethod
+    def parse_stale(
+        output: str, merged: set[str] | None, base_tip: str, created: Callable[[str], str | None]
+    ) -> dict[str, tuple[str, ...]]:
+        """Map branches that are merged or gone from origin to those reasons.
+
+        Without a merged set, a branch is contained in the base when it is 0
+        commits ahead. A contained branch still at the base tip, or at the
+        commit it was created from, has no work of its own yet and is not
+        counted as merged.
+        """
+        reasons: dict[str, tuple[str, ...]] = {}
+        for line in output.splitlines():
+            refname, tip, upstream, track, counts = [*line.split("\0"), "", "", "", ""][:5]
+            branch = refname.removeprefix("refs/heads/")
+            found = []
+            contained = branch in merged if merged is not None else counts.startswith("0 ")
+            if contained and tip != base_tip and tip != created(branch):
+                found.append("merged")
+            if upstream and "gone" in track:
+                found.append("gone from origin")
+            if found:
+                reasons[branch] = tuple(found)
+        return reasons
+
+    def try_stale_branches(self, project: Path) -> dict[str, tuple[str, ...]] | WTError:
+        try:
+            return self.stale_branches(project)
+        except WTError as exc:
+            return exc
+
+    def stale_branches(self, project: Path) -> dict[str, tuple[str, ...]]:
+        base = self.default_base_branch(project)
+        common = common_gitdir(project)
+        base_tip = resolve_ref(common, f"refs/remotes/origin/{base}") if common else None
+        if common is None or base_tip is None:
+            raise WTError(f"origin/{base} is missing in {project}; fetch it first")
+        result = self.git(project, *self.stale_arguments(base), check=False)
+        if result.returncode != 0:
+            raise command_failed(list(result.args), result.stdout, result.stderr)
+        merged = None
+        if not self.supports_ahead_behind():
+            # Older git: a second query answers what %(ahead-behind) would have.
+            listing = self.git(
+                project,
+                "for-each-ref",
+                f"--merged=refs/remotes/origin/{base}",
+                "--format=%(refname:lstrip=2)",
+                "refs/heads/",
+            )
+            merged = set(listing.stdout.splitlines())
+        return self.parse_stale(
+            result.stdout or "", merged, base_tip, lambda branch: branch_origin(common, branch)
+        )
+
+    @staticmethod
+    def idle_reason(worktree: Worktree, idle: float, now: float) -> tuple[str, ...]:
+        activity = worktree_activity(worktree.path) if idle else None
+        if activity is None or now - activity <= idle:
+            return ()
+        return (f"idle {format_age(now - activity)}",)
+
+    def gc(
+        self,
+        project_value: str | None,
+        *,
+        idle_days: int = DEFAULT_GC_IDLE_DAYS,
+        fetch: bool = True,
+        dry_run: bool = False,
+        yes: bool = False,
+    ) -> list[StaleWorktree]:
+        """Report stale managed worktrees, then remove the clean ones in one batch per project.
+
+        A worktree is stale when its branch is merged into origin's default
+        branch, its upstream was deleted on origin, or it was last checked out,
+        staged in or committed to more than idle_days ago (0 disables).
+        Branches themselves are kept. A project that cannot be fetched is
+        checked against its last fetched refs; one that cannot be checked at
+        all is reported as skipped while the others are still collected.
+        """
+        if project_value is None:
+            projects = self.managed_projects()
+        else:
+            projects = [self.resolve_project(project_value, managed_only=True)]
+        listings = dict(zip(projects, self.map_concurrently(self.managed_for, projects)))
+        projects = [project for project in projects if listings[project]]
+        problems: dict[Path, list[str]] = {}
+        if fetch:
+            # Prune so branches deleted on origin show up as gone.
+            fetched = self.map_concurrently(
+                lambda project: self.git(
+                    project, "fetch", "--prune", "--quiet", "origin", check=False
+                ),
+                projects,
+            )
+            for project, result in zip(projects, fetched):
+                if result.returncode != 0:
+                    detail = ((result.stderr or "").strip().splitlines() or ["unknown error"])[0]
+                    problems.setdefault(project, []).append(f"fetch failed ({detail})")
+        idle = idle_days * 24 * 60 * 60
+        now = time.time()
+        stale_by_project = self.map_concurrently(self.try_stale_branches, projects)
+        for project, stale in zip(projects, stale_by_project):
+            if isinstance(stale, WTError):
+                problems.setdefault(project, []).append(f"skipped ({stale})")
+        candidates = [
+            (
+                project,
+                worktree,
+                stale.get(worktree.branch or "", ()) + self.idle_reason(worktree, idle, now),
+            )
+            for project, stale in zip(projects, stale_by_project)
+            if not isinstance(stale, WTError)
+            for worktree in listings[project]
+        ]
+        entries = [entry for entry in candidates if entry[2]]
+        statuses = self.map_concurrently(
+            lambda entry: "locked" if entry[1].locked else self.status_of(entry[1]), entries
+        )
+        found = [
+            StaleWorktree(project, worktree, reasons, status)
+            for (project, worktree, reasons), status in zip(entries, statuses)
+        ]
+        found.sort(key=lambda item: self.row_order((item.project, item.worktree, "")))
+        removable = [item for item in found if item.removable]
+        self.print_stale(found, problems, dry_run=dry_run)
+        if dry_run or not removable:
+            return found
+
+        if not yes:
+            count = len({item.project for item in removable})
+            answer = self.input(
+                f"Remove {len(removable)} stale worktree(s) across {count} project(s)? [y/N] "
+            ).strip().lower()
+            if answer not in {"y", "yes"}:
+                raise WTError("gc cancelled")
+        failures: list[str] = []
+        for project in dict.fromkeys(item.project for item in removable):
+            worktrees = [item.worktree for item in removable if item.project == project]
+            try:
+                self.remove_many(project, worktrees, force=False)
+            except WTError as exc:
+                failures.append(str(exc))
+        if failures:
+            raise WTError("; ".join(failures))
+        return found
+
+    def print_stale(
+        self, found: list[StaleWorktree], problems: dict[Path, list[str]], *, dry_run: bool
+    ) -> None:
+        for project, notes in problems.items():
+            for note in notes:
+                print(f"{project.name}: {note}", file=self.stdout)
+        if not found:
+            print("No stale worktrees.", file=self.stdout)
+            return
+        verb = "would remove" if dry_run else "remove"
+        values = [
+            (
+                item.project.name,
+                item.worktree.branch or "(detached)",
+                ", ".join(item.reasons),
+                verb if item.removable else f"keep ({item.status})",
+                str(item.worktree.path),
+            )
+            for item in found
+        ]
+        widths = [
+            max(len(GC_HEADERS[index]), *(len(row[index]) for row in values))
+            for index in range(len(GC_HEADERS) - 1)
+        ]
+        for row in [GC_HEADERS, *values]:
+            self.print_row(row, widths)
+        self.stdout.flush()
+
+    def supports_ahead_behind(self) -> bool:
+        """Whether git knows %(ahead-behind:...), asking `git version` once per git binary."""
+        if self._ahead_behind is None:
+            key = self.git_feature_key("ahead-behind")
+            supported = self.git_features.get(key)
+            if not isinstance(supported, bool):
+                result = self.runner.run(["git", "version"], check=False)
+                version = self.parse_git_version(result.stdout or "")
+                supported = version >= AHEAD_BEHIND_GIT
+                if result.returncode == 0:
+                    self.git_features.put(key, supported)
+            self._ahead_behind = supported
+        return self._ahead_behind
+
+    @staticmethod
+    def parse_git_version(output: str) -> tuple[int, int]:
+        """(major, minor) from `git version` output, or (0, 0) when unrecognised."""
+        words = output.split()
+        numbers = words[2].split(".") if words[:2] == ["git", "version"] and words[2:] else []
+        try:
+            return int(numbers[0]), int(numbers[1])
+        except (IndexError, ValueError):
+            return 0, 0
+
+    @staticmethod
+    def git_feature_key(feature: str) -> str:
+        executable = shutil.which("git") or "git"
+        try:
+            stamp = os.stat(executable).st_mtime_ns
+        except OSError:
+            stamp = 0
+        return f"{feature}:{executable}:{stamp}"
+
+    def branch_info_arguments(self, project: Path) -> list[str]:
+        """One for-each-ref over every local branch: tip date and ahead/behind the base."""
+        fields = ["%(refname)", "%(committerdate:unix)"]
+        base = self.known_default_branch(project)
+        common = common_gitdir(project)
+        if (
+            self.supports_ahead_behind()
+            and base is not None
+            and common is not None
+            and resolve_ref(common, f"refs/remotes/origin/{base}") is not None
+        ):
+            fields.append(f"%(ahead-behind:refs/remotes/origin/{base})")
+        return ["for-each-ref", f"--format={'%00'.join(fields)}", "refs/heads/"]
+
+    @staticmethod
+    def parse_branch_info(output: str) -> dict[str, tuple[int | None, int | None, int | None]]:
+        """Map branch names to (ahead, behind, committed)."""
+        info: dict[str, tuple[int | None, int | None, int | None]] = {}
+        for line in output.splitlines():
+            refname, _, rest = line.partition("\0")
+            committed, _, counts = rest.partition("\0")
+            ahead, _, behind = counts.partition(" ")
+            info[refname.removeprefix("refs/heads/")] = (
+                int(ahead) if ahead.isdigit() else None,
+                int(behind) if behind.isdigit() else None,
+                int(committed) if committed.isdigit() else None,
+            )
+        return info
+
+    @staticmethod
+    def join_branch_info(
+        worktrees: list[Worktree], info: dict[str, tuple[int | None, int | None, int | None]]
+    ) -> list[Worktree]:
+        joined = []
         for worktree in worktrees:
-            self.remove_one(project, worktree, force=force)
-        return worktrees
+            ahead, behind, committed = info.get(worktree.branch or "", (None, None, None))
+            joined.append(replace(worktree, ahead=ahead, behind=behind, committed=committed))
+        return joined
+
+    def with_branch_info(self, project: Path, worktrees: list[Worktree]) -> list[Worktree]:
+        return self.drive(self.branch_info_steps(project, worktrees))
+
+    def branch_info_steps(self, project: Path, worktrees: list[Worktree]) -> Steps[list[Worktree]]:
+        if not any(worktree.branch for worktree in worktrees):
+            return worktrees
+        arguments = self.branch_info_arguments(project)
+        result = yield self.git_command(project, *arguments, check=False)
+        output = (result.stdout or "") if result.returncode == 0 else ""
+        return self.join_branch_info(worktrees, self.parse_branch_info(output))
+
+    def disk_usage(self) -> DiskUsage:
+        return DiskUsage(self.state_dir / "du.json", self.map_concurrently)
+
+    def with_disk_usage(self, listings: list[list[Worktree]]) -> list[list[Worktree]]:
+        """Every listing with sizes, from one load and one save of the scan cache."""
+        usage = self.disk_usage()
+        measured = []
+        for worktrees in listings:
+            sized = []
+            for worktree in worktrees:
+                totals = UsageTotals()
+                usage.measure(worktree.path, totals)
+                sized.append(replace(worktree, disk=totals.disk))
+            measured.append(sized)
+        usage.save()
+        return measured
+
+    def du(
+        self, project_value: str | None
+    ) -> tuple[list[tuple[Path, Worktree, UsageTotals]], UsageTotals]:
+        """Print managed worktrees by disk use, largest first, and their combined total."""
+        if project_value is None:
+            projects = self.managed_projects()
+        else:
+            projects = [self.resolve_project(project_value, managed_only=True)]
+        listings = self.map_concurrently(self.managed_for, projects)
+        usage = self.disk_usage()
+        total = UsageTotals()
+        rows = []
+        for project, worktrees in zip(projects, listings):
+            for worktree in worktrees:
+                totals = UsageTotals()
+                usage.measure(worktree.path, totals, total)
+                rows.append((project, worktree, totals))
+        usage.save(prune=project_value is None)
+        rows.sort(key=lambda row: (-row[2].disk, *self.row_order((row[0], row[1], ""))))
 
-    def list(self, project_value: str | None) -> list[tuple[Path, Worktree, str]]:
+        values = [
+            (
+                project.name,
+                worktree.branch or "(detached)",
+                format_size(totals.apparent),
+                format_size(totals.disk),
+                str(worktree.path),
+            )
+            for project, worktree, totals in rows
+        ]
+        values.append(("TOTAL", "", format_size(total.apparent), format_size(total.disk), ""))
+        widths = [
+            max(len(DU_HEADERS[index]), *(len(row[index]) for row in values))
+            for index in range(len(DU_HEADERS) - 1)
+        ]
+        for row in [DU_HEADERS, *values]:
+            self.print_row(row, widths)
+        return rows, total
+
+    def list(
+        self, project_value: str | None, *, output: str = "table", sizes: bool = False
+    ) -> list[tuple[Path, Worktree, str]]:
+        if output not in LIST_OUTPUTS:
+            raise WTError(f"unknown list output: {output}")
         if project_value is None:
             projects = self.managed_projects()
         else:
             projects = [self.resolve_project(project_value)]
 
+        listings = self.drive(self.listing_steps(projects))
+        if sizes:
+            listings = self.with_disk_usage(listings)
+        entries = self.list_entries(projects, listings)
+        if output == "table":
+            rows = self.drive(self.rows_steps(entries))
+        else:
+            rows = self.stream_rows(entries, ndjson=output == "ndjson")
+        return self.finish_list(rows, output)
+
+    def listing_steps(self, projects: list[Path]) -> Steps[list[list[Worktree]]]:
+        """Every project's managed worktrees, with branch information."""
+        return (yield [self.described_steps(project) for project in projects])
+
+    def described_steps(self, project: Path) -> Steps[list[Worktree]]:
+        worktrees = yield from self.managed_steps(project)
+        return (yield from self.branch_info_steps(project, worktrees))
+
+    @staticmethod
+    def list_entries(
+        projects: list[Path], listings: list[list[Worktree]]
+    ) -> list[tuple[Path, Worktree]]:
+        return [
+            (project, worktree)
+            for project, worktrees in zip(projects, listings)
+            for worktree in worktrees
+        ]
+
+    def rows_steps(
+        self, entries: list[tuple[Path, Worktree]]
+    ) -> Steps[list[tuple[Path, Worktree, str]]]:
+        statuses = yield [self.status_steps(worktree) for _, worktree in entries]
+        return [
+            (project, worktree, status) for (project, worktree), status in zip(entries, statuses)
+        ]
+
+    def finish_list(
+        self, rows: list[tuple[Path, Worktree, str]], output: str
+    ) -> list[tuple[Path, Worktree, str]]:
+        rows.sort(key=self.row_order)
+        if output == "table":
+            self.print_table(rows)
+        return rows
+
+    @staticmethod
+    def row_order(row: tuple[Path, Worktree, str]) -> tuple[str, str, str]:
+        return (row[0].name.lower(), row[1].branch or "", str(row[1].path))
+
+    def stream_rows(
+        self, entries: list[tuple[Path, Worktree]], *, ndjson: bool
+    ) -> list[tuple[Path, Worktree, str]]:
+        """Print each project's rows as soon as all of its statuses are known."""
+        widths = self.start_stream(entries, ndjson=ndjson)
+        pending: dict[Path, int] = {}
+        for project, _ in entries:
+            pending[project] = pending.get(project, 0) + 1
+        finished: dict[Path, list[tuple[Path, Worktree, str]]] = {}
         rows: list[tuple[Path, Worktree, str]] = []
-        for project in projects:
-            for worktree in self.managed_for(project):
-                if not worktree.path.exists():
-                    status = "missing"
-                else:
-                    status = "dirty" if self.is_dirty(worktree) else "clean"
-                rows.append((project, worktree, status))
-        rows.sort(key=lambda row: (row[0].name.lower(), row[1].branch or "", str(row[1].path)))
-        self.print_table(rows)
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            futures = {
+                pool.submit(self.status_of, worktree): (project, worktree)
+                for project, worktree in entries
+            }
+            for future in as_completed(futures):
+                project, worktree = futures[future]
+                finished.setdefault(project, []).append((project, worktree, future.result()))
+                pending[project] -= 1
+                if pending[project]:
+                    continue
+                rows.extend(self.emit_rows(finished.pop(project), widths, ndjson=ndjson))
         return rows
 
-    def print_table(self, rows: list[tuple[Path, Worktree, str]]) -> None:
-        headers = ("PROJECT", "BRANCH", "STATUS", "PATH")
-        values = [
-            (project.name, worktree.branch or "(detached)", status, str(worktree.path))
-            for project, worktree, status in rows
-        ]
-        widths = [
+    def start_stream(self, entries: list[tuple[Path, Worktree]], *, ndjson: bool) -> list[int]:
+        placeholders = [(project, worktree, STATUSES[-1]) for project, worktree in entries]
+        widths = self.table_widths(placeholders)
+        if not ndjson:
+            self.print_row(self.table_headers(placeholders), widths)
+            self.stdout.flush()
+        return widths
+
+    def emit_rows(
+        self, rows: list[tuple[Path, Worktree, str]], widths: list[int], *, ndjson: bool
+    ) -> list[tuple[Path, Worktree, str]]:
+        ready = sorted(rows, key=self.row_order)
+        for row in ready:
+            if ndjson:
+                print(json.dumps(self.row_record(row)), file=self.stdout)
+            else:
+                self.print_row(self.row_values(row), widths)
+        self.stdout.flush()
+        return ready
+
+    def status_of(self, worktree: Worktree, mode: str | None = None) -> str:
+        return self.drive(self.status_steps(worktree, mode))
+
+    def status_steps(self, worktree: Worktree, mode: str | None = None) -> Steps[str]:
+        if not worktree.path.exists():
+            return "missing"
+        return "dirty" if (yield from self.dirty_steps(worktree, mode)) else "clean"
+
+    @staticmethod
+    def row_values(row: tuple[Path, Worktree, str]) -> tuple[str, ...]:
+        project, worktree, status = row
+        base = "-"
+        if worktree.ahead is not None and worktree.behind is not None:
+            base = f"+{worktree.ahead} -{worktree.behind}"
+        age = "-"
+        if worktree.committed is not None:
+            age = format_age(max(0.0, time.time() - worktree.committed))
+        size = () if worktree.disk is None else (format_size(worktree.disk),)
+        return (
+            project.name,
+            worktree.branch or "(detached)",
+            status,
+            base,
+            age,
+            *size,
+            str(worktree.path),
+        )
+
+    @staticmethod
+    def row_record(row: tuple[Path, Worktree, str]) -> dict[str, object]:
+        project, worktree, status = row
+        return {
+            "project": project.name,
+            "project_path": str(project),
+            "branch": worktree.branch,
+            "status": status,
+            "path": str(worktree.path),
+            "locked": worktree.locked,
+            "ahead": worktree.ahead,
+            "behind": worktree.behind,
+            "committed": worktree.committed,
+            "disk": worktree.disk,
+        }
+
+    @staticmethod
+    def table_headers(rows: list[tuple[Path, Worktree, str]]) -> tuple[str, ...]:
+        if any(row[1].disk is not None for row in rows):
+            return (*TABLE_HEADERS[:-1], "DISK", TABLE_HEADERS[-1])
+        return TABLE_HEADERS
+
+    def table_widths(self, rows: list[tuple[Path, Worktree, str]]) -> list[int]:
+        headers = self.table_headers(rows)
+        values = [self.row_values(row) for row in rows]
+        return [
             max(len(headers[index]), *(len(row[index]) for row in values))
             if values
             else len(headers[index])
-            for index in range(3)
+            for index in range(len(headers) - 1)
         ]
-        print(
-            f"{headers[0]:<{widths[0]}}  {headers[1]:<{widths[1]}}  "
-            f"{headers[2]:<{widths[2]}}  {headers[3]}",
-            file=self.stdout,
+
+    def print_row(self, row: tuple[str, ...], widths: list[int]) -> None:
+        cells = [f"{value:<{width}}" for value, width in zip(row, widths)]
+        print("  ".join([*cells, row[-1]]), file=self.stdout)
+
+    def print_rows(self, rows: list[tuple[Path, Worktree, str]], output: str) -> None:
+        """Print rows that are already complete, e.g. as answered by the daemon."""
+        if output == "ndjson":
+            for row in rows:
+                print(json.dumps(self.row_record(row)), file=self.stdout)
+        else:
+            self.print_table(rows)
+
+    def print_table(self, rows: list[tuple[Path, Worktree, str]]) -> None:
+        widths = self.table_widths(rows)
+        self.print_row(self.table_headers(rows), widths)
+        for row in rows:
+            self.print_row(self.row_values(row), widths)
+
+    # The same operations on an event loop, as the daemon runs them: commands
+    # are started by the AsyncRunner (or the injected runner, on worker threads).
+
+    async def run_async(
+        self, command: list[str], **kwargs: Any
+    ) -> subprocess.CompletedProcess[str]:
+        if self.async_runner is not None:
+            return await self.async_runner.run(command, **kwargs)
+        return await asyncio.to_thread(self.runner.run, command, **kwargs)
+
+    async def git_async(
+        self, project: Path, *arguments: str, check: bool = True
+    ) -> subprocess.CompletedProcess[str]:
+        return await self.run_async(["git", "-C", str(project), *arguments], check=check)
+
+    async def drive_async(self, steps: Steps[R]) -> R:
+        """Run an operation's commands on the event loop; see drive."""
+        value: Any = None
+        error: WTError | None = None
+        with contextlib.closing(steps):
+            while True:
+                try:
+                    request = steps.throw(error) if error is not None else steps.send(value)
+                except StopIteration as done:
+                    return done.value
+                value, error = None, None
+                try:
+                    if isinstance(request, list):
+                        value = list(
+                            await asyncio.gather(*(self.execute_async(item) for item in request))
+                        )
+                    else:
+                        value = await self.execute_async(request)
+                except WTError as exc:
+                    error = exc
+
+    async def execute_async(self, request: Command | Steps[Any]) -> Any:
+        if not isinstance(request, Command):
+            return await self.drive_async(request)
+        if not request.first_line:
+            return await self.run_async(list(request.argv), check=request.check)
+        if self.async_runner is not None:
+            return await self.async_runner.first_line(list(request.argv))
+        return await asyncio.to_thread(self.runner.first_line, list(request.argv))
+
+    async def managed_projects_async(self) -> list[Path]:
+        return await self.drive_async(self.managed_projects_steps())
+
+    async def managed_for_async(self, project: Path) -> list[Worktree]:
+        return await self.drive_async(self.managed_steps(project))
+
+    async def with_branch_info_async(
+        self, project: Path, worktrees: list[Worktree]
+    ) -> list[Worktree]:
+        return await self.drive_async(self.branch_info_steps(project, worktrees))
+
+    async def status_of_async(self, worktree: Worktree, mode: str | None = None) -> str:
+        return await self.drive_async(self.status_steps(worktree, mode))
+
+    async def discover_projects_async(self) -> list[Path]:
+        return await self.drive_async(self.discover_steps())
+
+    async def list_async(
+        self, project_value: str | None, *, output: str = "table", sizes: bool = False
+    ) -> list[tuple[Path, Worktree, str]]:
+        if output not in LIST_OUTPUTS:
+            raise WTError(f"unknown list output: {output}")
+        if project_value is None:
+            projects = await self.managed_projects_async()
+        else:
+            projects = [self.resolve_project(project_value)]
+
+        listings = await self.drive_async(self.listing_steps(projects))
+        if sizes:
+            listings = await asyncio.to_thread(self.with_disk_usage, listings)
+        entries = self.list_entries(projects, listings)
+        if output == "table":
+            rows = await self.drive_async(self.rows_steps(entries))
+        else:
+            rows = await self.stream_rows_async(entries, ndjson=output == "ndjson")
+        return self.finish_list(rows, output)
+
+    async def stream_rows_async(
+        self, entries: list[tuple[Path, Worktree]], *, ndjson: bool
+    ) -> list[tuple[Path, Worktree, str]]:
+        """Like stream_rows: each project's rows print once all of its statuses are known."""
+        widths = self.start_stream(entries, ndjson=ndjson)
+        projects = dict.fromkeys(project for project, _ in entries)
+        pending = [
+            self.drive_async(self.rows_steps([entry for entry in entries if entry[0] == project]))
+            for project in projects
+        ]
+        rows: list[tuple[Path, Worktree, str]] = []
+        for finished in asyncio.as_completed(pending):
+            rows.extend(self.emit_rows(await finished, widths, ndjson=ndjson))
+        return rows
+
+    async def remove_many_async(
+        self, project: Path, worktrees: list[Worktree], *, force: bool
+    ) -> None:
+        await asyncio.to_thread(self.forget_integrations, worktrees)
+        await self.drive_async(self.removal_steps(project, worktrees, force=force))
+
+    async def clean_async(
+        self, project_value: str, *, force: bool, yes: bool
+    ) -> list[Worktree]:
+        project = self.resolve_project(project_value)
+        worktrees = await self.drive_async(self.clean_steps(project, force=force, yes=yes))
+        if worktrees:
+            await self.remove_many_async(project, worktrees, force=force)
+        return worktrees
+
+
+def worktree_record(worktree: Worktree) -> dict[str, object]:
+    return {
+        "path": str(worktree.path),
+        "branch": worktree.branch,
+        "head": worktree.head,
+        "bare": worktree.bare,
+        "detached": worktree.detached,
+        "locked": worktree.locked,
+        "lock_reason": worktree.lock_reason,
+        "ahead": worktree.ahead,
+        "behind": worktree.behind,
+        "committed": worktree.committed,
+    }
+
+
+def worktree_from_record(record: dict[str, Any]) -> Worktree:
+    return Worktree(
+        path=Path(record["path"]),
+        branch=record.get("branch"),
+        head=record.get("head"),
+        bare=bool(record.get("bare")),
+        detached=bool(record.get("detached")),
+        locked=bool(record.get("locked")),
+        lock_reason=record.get("lock_reason"),
+        ahead=record.get("ahead"),
+        behind=record.get("behind"),
+        committed=record.get("committed"),
+    )
+
+
+class Inotify:
+    """Minimal ctypes binding for Linux inotify; raises OSError elsewhere."""
+
+    CREATE = 0x100
+    MOVED_TO = 0x80
+    CHANGES = 0x2 | 0x4 | 0x8 | 0x40 | MOVED_TO | CREATE | 0x200 | 0x400 | 0x800
+    IGNORED = 0x8000
+    ISDIR = 0x40000000
+    EVENT = struct.Struct("iIII")
+
+    def __init__(self) -> None:
+        try:
+            self.libc = ctypes.CDLL(None, use_errno=True)
+            init = self.libc.inotify_init1
+        except (OSError, AttributeError) as exc:
+            raise OSError("inotify is not available on this system") from exc
+        self.fd = init(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+    def add(self, path: Path) -> int | None:
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(path), self.CHANGES)
+        return wd if wd >= 0 else None
+
+    def read(self) -> list[tuple[int, int, str]]:
+        """Drain pending events as (watch descriptor, mask, entry name) triples."""
+        events: list[tuple[int, int, str]] = []
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return events
+            offset = 0
+            while offset + self.EVENT.size <= len(data):
+                wd, mask, _cookie, length = self.EVENT.unpack_from(data, offset)
+                start = offset + self.EVENT.size
+                name = os.fsdecode(data[start : start + length].rstrip(b"\0"))
+                events.append((wd, mask, name))
+                offset = start + length
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class WarmState:
+    """Worktree listings, owners and statuses kept current by inotify.
+
+    The managed root and each project's common gitdir (for worktrees/) are
+    watched, so listings are exact. Each worktree's directories, except .git
+    and those Git ignores, and its admin directory (index, HEAD) are watched;
+    an event there marks the worktree's status stale and it is re-probed in
+    the background. Branch info is refreshed on request after an event in the
+    common gitdir or an admin directory. Nothing is polled, except statuses
+    of worktrees with more directories than DAEMON_MAX_WATCHES.
+    """
+
+    def __init__(
+        self,
+        manager: WorktreeManager,
+        watcher: Inotify,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.manager = manager
+        self.watcher = watcher
+        self.clock = clock
+        self.projects: list[Path] | None = None
+        self.listings: dict[Path, list[Worktree]] = {}
+        self.statuses: dict[tuple[Path, str], tuple[str, float]] = {}
+        self.described: dict[Path, tuple[list[Worktree], list[Worktree]]] = {}
+        # Watch descriptor -> (kind, the worktree or project it concerns, watched path).
+        self.watches: dict[int, tuple[str, Path, Path]] = {}
+        self.owners: dict[Path, Path] = {}
+        self.trees: dict[Path, int] = {}
+        self.partial: set[Path] = set()
+        self.changed: set[Path] = set()
+        # Directories created in a worktree since keep_warm last looked.
+        self.created: dict[Path, list[Path]] = {}
+        self.wake = asyncio.Event()
+        self.modes = {manager.dirty_mode}
+
+    def watch(self, kind: str, path: Path, key: Path) -> bool:
+        """Watch path; events invalidate whatever kind and key name."""
+        wd = self.watcher.add(path)
+        if wd is None:
+            return False
+        if wd not in self.watches and kind in ("tree", "admin"):
+            self.trees[key] = self.trees.get(key, 0) + 1
+        self.watches[wd] = (kind, key, path)
+        return True
+
+    def forget(self, wd: int) -> None:
+        kind, key, _ = self.watches.pop(wd, ("", Path(), Path()))
+        if kind in ("tree", "admin") and key in self.trees:
+            self.trees[key] -= 1
+            if not self.trees[key]:
+                del self.trees[key]
+                self.partial.discard(key)
+
+    def watch_tree(self, worktree: Path, directories: list[Path], complete: bool) -> None:
+        for directory in directories:
+            if self.trees.get(worktree, 0) >= DAEMON_MAX_WATCHES:
+                complete = False
+                break
+            complete = self.watch("tree", directory, worktree) and complete
+        if not complete:
+            self.partial.add(worktree)
+
+    @staticmethod
+    def tree_directories(top: Path, skip: set[Path]) -> tuple[list[Path], bool]:
+        """Directories under top to watch, and whether that is all of them."""
+        found = [top]
+        index = 0
+        while index < len(found):
+            directory = found[index]
+            index += 1
+            try:
+                with os.scandir(directory) as entries:
+                    children = [
+                        Path(entry.path)
+                        for entry in entries
+                        if entry.is_dir(follow_symlinks=False) and entry.name != ".git"
+                    ]
+            except OSError:
+                continue
+            found.extend(child for child in children if child not in skip)
+            if len(found) > DAEMON_MAX_WATCHES:
+                return found[:DAEMON_MAX_WATCHES], False
+        return found, True
+
+    async def ignored_directories(self, worktree: Path) -> set[Path]:
+        # Changes inside an ignored directory never change a status, in any mode.
+        result = await self.manager.git_async(
+            worktree,
+            "ls-files",
+            "-z",
+            "--others",
+            "--ignored",
+            "--exclude-standard",
+            "--directory",
+            check=False,
         )
-        for row in values:
-            print(
-                f"{row[0]:<{widths[0]}}  {row[1]:<{widths[1]}}  "
-                f"{row[2]:<{widths[2]}}  {row[3]}",
-                file=self.stdout,
+        entries = (result.stdout or "").split("\0") if result.returncode == 0 else []
+        return {worktree / entry.rstrip("/") for entry in entries if entry.endswith("/")}
+
+    def handle_events(self) -> None:
+        for wd, mask, name in self.watcher.read():
+            if mask & Inotify.IGNORED:
+                self.forget(wd)
+                continue
+            kind, key, path = self.watches.get(wd, ("", Path(), Path()))
+            if kind == "root":
+                self.projects = None
+            elif kind == "common":
+                self.described.pop(key, None)
+                if name == "worktrees":
+                    self.listings.pop(key, None)
+                    self.projects = None
+                    if mask & Inotify.CREATE:
+                        self.watch("worktrees", path / name, key)
+            elif kind == "worktrees":
+                self.listings.pop(key, None)
+                self.described.pop(key, None)
+                self.projects = None
+            elif kind == "admin":
+                self.described.pop(self.owners.get(key, Path()), None)
+                if name == "locked":
+                    self.listings.pop(self.owners.get(key, Path()), None)
+                self.stale(key)
+            elif kind == "tree":
+                if mask & Inotify.ISDIR and mask & (Inotify.CREATE | Inotify.MOVED_TO):
+                    self.created.setdefault(key, []).append(path / name)
+                self.stale(key)
+
+    async def watch_created(self) -> None:
+        """Watch new directories, unless Git ignores them once they exist."""
+        created, self.created = self.created, {}
+        for worktree, directories in created.items():
+            skip = await self.ignored_directories(worktree)
+            for directory in directories:
+                if any(ignored == directory or ignored in directory.parents for ignored in skip):
+                    continue
+                found, complete = await asyncio.to_thread(self.tree_directories, directory, skip)
+                self.watch_tree(worktree, found, complete)
+
+    def stale(self, worktree: Path) -> None:
+        for mode in DIRTY_MODES:
+            self.statuses.pop((worktree, mode), None)
+        self.changed.add(worktree)
+        self.wake.set()
+
+    async def managed_projects(self) -> list[Path]:
+        if self.projects is None:
+            self.watch("root", self.manager.root, self.manager.root)
+            self.projects = await self.manager.managed_projects_async()
+        return self.projects
+
+    async def worktrees(self, project: Path) -> list[Worktree]:
+        listing = self.listings.get(project)
+        if listing is None:
+            common = common_gitdir(project)
+            if common is not None:
+                self.watch("common", common, project)
+                if (common / "worktrees").is_dir():
+                    self.watch("worktrees", common / "worktrees", project)
+            listing = await self.manager.managed_for_async(project)
+            self.listings[project] = listing
+            await asyncio.gather(
+                *(self.watch_worktree(project, worktree.path) for worktree in listing)
             )
+        return listing
+
+    async def watch_worktree(self, project: Path, worktree: Path) -> None:
+        self.owners[worktree] = project
+        if worktree in self.trees:
+            return
+        admin = linked_gitdir(worktree)
+        if admin is not None:
+            self.watch("admin", admin, worktree)
+        skip = await self.ignored_directories(worktree)
+        directories, complete = await asyncio.to_thread(self.tree_directories, worktree, skip)
+        self.watch_tree(worktree, directories, complete)
+
+    async def describe(self, project: Path) -> list[Worktree]:
+        """The project's listing with branch info, until refs or the listing change."""
+        listing = await self.worktrees(project)
+        cached = self.described.get(project)
+        if cached is not None and cached[0] is listing:
+            return cached[1]
+        described = await self.manager.with_branch_info_async(project, listing)
+        self.described[project] = (listing, described)
+        return described
+
+    async def status(self, worktree: Worktree, mode: str) -> str:
+        cached = self.statuses.get((worktree.path, mode))
+        if cached is not None and (
+            worktree.path not in self.partial or self.clock() - cached[1] < DAEMON_STATUS_TTL
+        ):
+            return cached[0]
+        status = await self.manager.status_of_async(worktree, mode)
+        self.statuses[(worktree.path, mode)] = (status, self.clock())
+        return status
+
+    async def rows(self, project: Path | None, mode: str) -> list[tuple[Path, Worktree, str]]:
+        # Writes queue their events synchronously, so draining them here means
+        # an edit made just before `wt list` is always seen.
+        self.handle_events()
+        self.modes.add(mode)
+        projects = [project] if project is not None else await self.managed_projects()
+        listings = await asyncio.gather(*(self.describe(item) for item in projects))
+        entries = [
+            (item, worktree)
+            for item, worktrees in zip(projects, listings)
+            for worktree in worktrees
+        ]
+        statuses = await asyncio.gather(
+            *(self.status(worktree, mode) for _, worktree in entries)
+        )
+        rows = [(item, worktree, status) for (item, worktree), status in zip(entries, statuses)]
+        return sorted(rows, key=self.manager.row_order)
+
+    async def keep_warm(self) -> None:
+        """Re-probe the statuses of worktrees inotify reported as changed."""
+        while True:
+            await self.wake.wait()
+            await asyncio.sleep(DAEMON_SETTLE)
+            self.handle_events()
+            self.wake.clear()
+            with contextlib.suppress(WTError, OSError):
+                # Before probing, so nothing written inside them after the probe is missed.
+                await self.watch_created()
+            changed, self.changed = self.changed, set()
+            known = {
+                worktree.path: worktree
+                for listing in self.listings.values()
+                for worktree in listing
+            }
+            probes = [
+                self.status(known[path], mode)
+                for path in changed
+                if path in known
+                for mode in self.modes
+            ]
+            with contextlib.suppress(WTError, OSError):
+                await asyncio.gather(*probes)
+            self.manager.completions.save()
+
+
+class Daemon:
+    """`wt daemon`: answers read-only queries from warm state over a Unix socket.
+
+    Only `list` is served. delete and clean always check safety directly.
+    """
+
+    def __init__(self, manager: WorktreeManager) -> None:
+        self.manager = manager
+        self.socket_path = manager.daemon_socket
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request = json.loads(await reader.readline())
+            response = await self.answer(request)
+        except (WTError, OSError, ValueError, KeyError, TypeError) as exc:
+            response = {"ok": False, "error": str(exc)}
+        writer.write(json.dumps(response).encode() + b"\n")
+        with contextlib.suppress(ConnectionError):
+            await writer.drain()
+        writer.close()
+
+    async def answer(self, request: dict[str, Any]) -> dict[str, object]:
+        if request.get("protocol") != DAEMON_PROTOCOL:
+            return {"ok": False, "error": "protocol mismatch"}
+        if request["op"] == "ping":
+            return {"ok": True}
+        if request["op"] == "list":
+            mode = request.get("dirty_mode", self.manager.dirty_mode)
+            if mode not in DIRTY_MODES:
+                raise WTError(f"unknown dirty check mode: {mode}")
+            project = Path(request["project"]) if request.get("project") else None
+            rows = await self.state.rows(project, mode)
+            return {
+                "ok": True,
+                "rows": [
+                    {"project": str(item), "worktree": worktree_record(worktree), "status": status}
+                    for item, worktree, status in rows
+                ],
+            }
+        raise WTError(f"unknown daemon request: {request['op']}")
+
+    async def serve(self, ready: Callable[[], None] | None = None) -> None:
+        if DaemonClient(self.socket_path).request("ping") is not None:
+            raise WTError(f"daemon already running on {self.socket_path}")
+        self.socket_path.unlink(missing_ok=True)
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        watcher = Inotify()
+        self.state = WarmState(self.manager, watcher)
+        loop = asyncio.get_running_loop()
+        loop.add_reader(watcher.fd, self.state.handle_events)
+        server = await asyncio.start_unix_server(self.handle, path=str(self.socket_path))
+        warm = asyncio.create_task(self.state.keep_warm())
+        try:
+            await self.state.rows(None, self.manager.dirty_mode)
+            if ready is not None:
+                ready()
+            async with server:
+                await server.serve_forever()
+        finally:
+            warm.cancel()
+            loop.remove_reader(watcher.fd)
+            watcher.close()
+            self.socket_path.unlink(missing_ok=True)
+
+
+class DaemonClient:
+    """Talks to a running `wt daemon`; every failure means "ask git directly"."""
+
+    def __init__(self, socket_path: Path, timeout: float = 2.0) -> None:
+        self.socket_path = socket_path
+        self.timeout = timeout
+
+    def request(self, op: str, **parameters: object) -> dict[str, Any] | None:
+        if not self.socket_path.exists():
+            return None
+        payload = json.dumps({"protocol": DAEMON_PROTOCOL, "op": op, **parameters}) + "\n"
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+                connection.settimeout(self.timeout)
+                connection.connect(str(self.socket_path))
+                connection.sendall(payload.encode())
+                with connection.makefile("rb") as stream:
+                    response = json.loads(stream.readline())
+        except (OSError, ValueError):
+            return None
+        return response if isinstance(response, dict) and response.get("ok") else None
+
+    def list_rows(
+        self, project: Path | None, dirty_mode: str
+    ) -> list[tuple[Path, Worktree, str]] | None:
+        response = self.request(
+            "list", project=str(project) if project else None, dirty_mode=dirty_mode
+        )
+        if response is None:
+            return None
+        return [
+            (Path(row["project"]), worktree_from_record(row["worktree"]), row["status"])
+            for row in response["rows"]
+        ]
+
+
+def positive_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"not an integer: {value}") from exc
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1: {value}")
+    return number
+
+
+def non_negative_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"not an integer: {value}") from exc
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must not be negative: {value}")
+    return number
+
+
+def add_dirty_check(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--dirty-check",
+        choices=tuple(DIRTY_MODES),
+        default=DEFAULT_DIRTY_MODE,
+        help=(
+            "what counts as dirty: tracked changes, untracked files too, or ignored "
+            f"files too (default: {DEFAULT_DIRTY_MODE})"
+        ),
+    )
 
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Manage Git worktrees under ~/.worktrees")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=positive_int,
+        default=DEFAULT_JOBS,
+        help=f"maximum concurrent Git status probes (default: {DEFAULT_JOBS})",
+    )
+    parser.add_argument(
+        "--depth",
+        type=positive_int,
+        default=1,
+        help="how many directory levels below the cwd to search for projects (default: 1)",
+    )
+    parser.add_argument(
+        "--ignore",
+        action="append",
+        default=[],
+        metavar="NAME",
+        help="directory name to skip while searching for projects (repeatable)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="print a per-command subprocess timing summary to stderr",
+    )
+    parser.add_argument(
+        "--profile-trace",
+        type=Path,
+        metavar="FILE",
+        help="write subprocess timings as a Chrome trace JSON file",
+    )
     commands = parser.add_subparsers(dest="command", required=True)
 
     new = commands.add_parser("new", help="create and connect to a worktree")
     new.add_argument("project", nargs="?")
-    new.add_argument("branch", nargs="?")
+    new.add_argument(
+        "branches",
+        nargs="*",
+        metavar="branch",
+        help="several branches (or - to read them from stdin) create worktrees in bulk "
+        "without connecting to them",
+    )
     new.add_argument(
         "--base",
         help="origin branch to start from (default: origin's advertised default branch)",
     )
+    new.add_argument(
+        "--refresh-default",
+        action="store_true",
+        help="ask origin for its default branch instead of using origin/HEAD or the cache",
+    )
+    new.add_argument(
+        "--fetch",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="always (or never) fetch the base branch; by default it is fetched unless "
+        "it already was within --fetch-ttl seconds or is missing locally",
+    )
+    new.add_argument(
+        "--sparse",
+        action="append",
+        metavar="DIR",
+        help="check out only DIR (repeatable; sparse-checkout cone mode)",
+    )
+    new.add_argument(
+        "--sparse-profile",
+        metavar="NAME",
+        help="check out only the directories listed in the project's "
+        "wt-sparse.NAME.path Git config",
+    )
+    new.add_argument(
+        "--seed",
+        action="append",
+        metavar="DIR",
+        help="copy DIR (e.g. node_modules) from the primary checkout with reflinks, "
+        "hardlinks or plain copies (repeatable; added to the project's wt.seed config)",
+    )
+    new.add_argument(
+        "--no-seed",
+        action="store_true",
+        help="ignore the project's wt.seed config",
+    )
+    new.add_argument(
+        "--fetch-ttl",
+        type=non_negative_int,
+        default=DEFAULT_FETCH_TTL,
+        help=f"seconds a base branch fetch stays fresh (default: {DEFAULT_FETCH_TTL})",
+    )
 
     delete = commands.add_parser("delete", help="remove one managed worktree")
     delete.add_argument("project", nargs="?")
     delete.add_argument("branch", nargs="?")
     delete.add_argument("--force", action="store_true", help="allow removal of a dirty worktree")
+    add_dirty_check(delete)
 
     clean = commands.add_parser("clean", help="remove every managed worktree for a project")
     clean.add_argument("project")
     clean.add_argument("--force", action="store_true", help="allow removal of dirty worktrees")
     clean.add_argument("--yes", action="store_true", help="skip confirmation")
+    add_dirty_check(clean)
 
     listing = commands.add_parser("list", help="list managed worktrees")
     listing.add_argument("project", nargs="?")
+    add_dirty_check(listing)
+    listing.add_argument(
+        "--output",
+        choices=LIST_OUTPUTS,
+        default="table",
+        help="table (default), stream rows per project as they resolve, or ndjson",
+    )
+    listing.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="query Git directly even when a wt daemon is running",
+    )
+    listing.add_argument(
+        "--size",
+        action="store_true",
+        help="add each worktree's disk usage (as measured by du; never asks the daemon)",
+    )
+
+    gc = commands.add_parser(
+        "gc",
+        help="remove clean worktrees whose branch is merged, gone from origin or idle",
+    )
+    gc.add_argument("project", nargs="?")
+    gc.add_argument(
+        "--idle",
+        type=non_negative_int,
+        default=DEFAULT_GC_IDLE_DAYS,
+        metavar="DAYS",
+        help="also collect worktrees not checked out, staged in or committed to for DAYS days "
+        f"(default: {DEFAULT_GC_IDLE_DAYS}; 0 disables)",
+    )
+    gc.add_argument(
+        "--fetch",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="fetch --prune origin first so deleted branches are noticed (default: on)",
+    )
+    gc.add_argument(
+        "--dry-run", action="store_true", help="only report what would be removed"
+    )
+    gc.add_argument("--yes", action="store_true", help="skip confirmation")
+    add_dirty_check(gc)
+
+    du = commands.add_parser(
+        "du", help="show apparent and on-disk size of managed worktrees, largest first"
+    )
+    du.add_argument("project", nargs="?")
+
+    commands.add_parser(
+        "daemon", help="keep worktree state warm for faster list (runs in the foreground)"
+    )
+
+    pool = commands.add_parser(
+        "pool", help="keep ready-made worktrees of a project's default branch for new"
+    )
+    pool.add_argument("project")
+    pool.add_argument(
+        "--size",
+        type=int,
+        help=f"how many to keep (0 removes the pool, at most {MAX_POOL_SIZE})",
+    )
     return parser
 
 
 def main(argv: list[str] | None = None) -> int:
-    args = build_parser().parse_args(argv)
-    manager = WorktreeManager(input_fn=terminal_input)
+    arguments = sys.argv[1:] if argv is None else argv
+    if arguments[:1] == ["__complete"]:
+        return wt_complete.main(arguments[1:])
+    args = build_parser().parse_args(arguments)
+    trace = CommandTrace() if args.profile or args.profile_trace else None
+    manager = WorktreeManager(
+        runner=Runner(trace),
+        async_runner=AsyncRunner(args.jobs, trace),
+        input_fn=terminal_input,
+        jobs=args.jobs,
+        dirty_mode=getattr(args, "dirty_check", DEFAULT_DIRTY_MODE),
+        discovery_depth=args.depth,
+        discovery_ignore=DEFAULT_DISCOVERY_IGNORE | set(args.ignore),
+        fetch_ttl=getattr(args, "fetch_ttl", DEFAULT_FETCH_TTL),
+    )
+    try:
+        return run_command(manager, args)
+    finally:
+        manager.completions.save()
+        if trace is not None:
+            report_profile(trace, args.profile, args.profile_trace)
+
+
+def report_profile(trace: CommandTrace, summary: bool, trace_path: Path | None) -> None:
+    if summary:
+        trace.print_summary(sys.stderr)
+    if trace_path is not None:
+        try:
+            trace.write_chrome_trace(trace_path)
+        except OSError as exc:
+            print(f"wt: cannot write profile trace: {exc}", file=sys.stderr)
+
+
+def list_worktrees(manager: WorktreeManager, args: argparse.Namespace) -> None:
+    if not args.no_daemon and not args.size:
+        project = manager.resolve_project(args.project) if args.project else None
+        rows = DaemonClient(manager.daemon_socket).list_rows(project, manager.dirty_mode)
+        if rows is not None:
+            manager.print_rows(rows, args.output)
+            return
+    manager.list(args.project, output=args.output, sizes=args.size)
+
+
+def run_command(manager: WorktreeManager, args: argparse.Namespace) -> int:
     try:
         if args.command == "new":
-            manager.new(args.project, args.branch, args.base)
+            branches = sys.stdin.read().split() if args.branches == ["-"] else args.branches
+            if args.branches == ["-"] or len(branches) > 1:
+                manager.new_many(
+                    args.project,
+                    branches,
+                    args.base,
+                    refresh_default=args.refresh_default,
+                    fetch=args.fetch,
+                    sparse=args.sparse,
+                    sparse_profile=args.sparse_profile,
+                    seed=args.seed,
+                    seed_config=not args.no_seed,
+                )
+            else:
+                manager.new(
+                    args.project,
+                    branches[0] if branches else None,
+                    args.base,
+                    refresh_default=args.refresh_default,
+                    fetch=args.fetch,
+                    sparse=args.sparse,
+                    sparse_profile=args.sparse_profile,
+                    seed=args.seed,
+                    seed_config=not args.no_seed,
+                )
         elif args.command == "delete":
             manager.delete(args.project, args.branch, force=args.force)
         elif args.command == "clean":
             manager.clean(args.project, force=args.force, yes=args.yes)
         elif args.command == "list":
-            manager.list(args.project)
+            list_worktrees(manager, args)
+        elif args.command == "gc":
+            manager.gc(
+                args.project,
+                idle_days=args.idle,
+                fetch=args.fetch,
+                dry_run=args.dry_run,
+                yes=args.yes,
+            )
+        elif args.command == "du":
+            manager.du(args.project)
+        elif args.command == "daemon":
+            asyncio.run(Daemon(manager).serve())
+        elif args.command == "pool":
+            manager.pool(args.project, size=args.size)
         return 0
     except (WTError, OSError, EOFError) as exc:
         print(f"wt: {exc}", file=sys.stderr)
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""Shell completion for wt, answered from the snapshot normal commands leave.
+
+`wt __complete WORD...` receives the words after `wt`, the last one being the
+word under the cursor, and prints one candidate per line. This module only
+imports json, os and sys and never starts a subprocess, so a TAB press costs
+an interpreter start and one small file read. wt.py refreshes the snapshot as
+a side effect of list, new, delete and clean.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+
+SNAPSHOT_NAME = "completion.json"
+SNAPSHOT_VERSION = 1
+
+COMMANDS = ("new", "delete", "clean", "gc", "list", "du", "daemon", "pool")
+# Option name -> whether it takes a value. Kept in sync with build_parser().
+GLOBAL_OPTIONS = {
+    "-j": True,
+    "--jobs": True,
+    "--depth": True,
+    "--ignore": True,
+    "--profile": False,
+    "--profile-trace": True,
+}
+COMMAND_OPTIONS = {
+    "new": {
+        "--base": True,
+        "--refresh-default": False,
+        "--fetch": False,
+        "--no-fetch": False,
+        "--sparse": True,
+        "--sparse-profile": True,
+        "--seed": True,
+        "--no-seed": False,
+        "--fetch-ttl": True,
+    },
+    "delete": {"--force": False, "--dirty-check": True},
+    "clean": {"--force": False, "--yes": False, "--dirty-check": True},
+    "list": {"--dirty-check": True, "--output": True, "--no-daemon": False, "--size": False},
+    "gc": {
+        "--idle": True,
+        "--fetch": False,
+        "--no-fetch": False,
+        "--dry-run": False,
+        "--yes": False,
+        "--dirty-check": True,
+    },
+    "du": {},
+    "daemon": {},
+    "pool": {"--size": True},
+}
+OPTION_CHOICES = {
+    "--dirty-check": ("tracked", "untracked", "ignored"),
+    "--output": ("table", "stream", "ndjson"),
+}
+# What each positional argument of a command names.
+POSITIONALS = {
+    "new": ("project", "new-branch"),
+    "delete": ("managed-project", "managed-branch"),
+    "clean": ("managed-project",),
+    "list": ("managed-project",),
+    "gc": ("managed-project",),
+    "du": ("managed-project",),
+    "pool": ("project",),
+}
+
+
+def default_snapshot_path() -> str:
+    return os.path.join(os.path.expanduser("~"), ".worktrees", ".wt", SNAPSHOT_NAME)
+
+
+def load_snapshot(path: str) -> dict[str, dict]:
+    try:
+        with open(path, encoding="utf-8") as stream:
+            data = json.load(stream)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != SNAPSHOT_VERSION:
+        return {}
+    return data
+
+
+class Snapshot:
+    def __init__(self, data: dict[str, dict], cwd: str) -> None:
+        searches = data.get("searches")
+        projects = data.get("projects")
+        self.discovered = searches.get(cwd, []) if isinstance(searches, dict) else []
+        self.projects = projects if isinstance(projects, dict) else {}
+        self.cwd = cwd
+
+    def managed_projects(self) -> list[str]:
+        return [
+            path
+            for path, entry in self.projects.items()
+            if isinstance(entry, dict) and entry.get("managed")
+        ]
+
+    def project_names(self, *, managed_only: bool) -> list[str]:
+        paths = self.managed_projects()
+        if not managed_only:
+            paths = [*self.discovered, *paths]
+        return sorted({os.path.basename(path) for path in paths})
+
+    def find_project(self, value: str) -> dict:
+        """Mirror resolve_project: a path first, otherwise a unique name."""
+        candidate = os.path.realpath(os.path.join(self.cwd, os.path.expanduser(value)))
+        if candidate in self.projects:
+            return self.projects[candidate]
+        matches = {
+            path
+            for path in [*self.discovered, *self.projects]
+            if os.path.basename(path) == value
+        }
+        if len(matches) != 1:
+            return {}
+        entry = self.projects.get(matches.pop())
+        return entry if isinstance(entry, dict) else {}
+
+    def branches(self, project: str | None, key: str) -> list[str]:
+        if project is None:
+            return []
+        values = self.find_project(project).get(key)
+        return [str(value) for value in values] if isinstance(values, list) else []
+
+
+def candidates(words: list[str], snapshot: Snapshot) -> list[str]:
+    *done, current = words or [""]
+    command: str | None = None
+    positionals: list[str] = []
+    pending: str | None = None
+    for word in done:
+        if pending is not None:
+            pending = None
+            continue
+        options = GLOBAL_OPTIONS if command is None else COMMAND_OPTIONS.get(command, {})
+        if word.startswith("-"):
+            name, has_value, _ = word.partition("=")
+            if options.get(name) and not has_value:
+                pending = name
+        elif command is None:
+            command = word
+        else:
+            positionals.append(word)
+
+    project = positionals[0] if positionals else None
+    if pending == "--base":
+        return snapshot.branches(project, "bases")
+    if pending is not None:
+        return list(OPTION_CHOICES.get(pending, ()))
+    if current.startswith("-"):
+        options = GLOBAL_OPTIONS if command is None else COMMAND_OPTIONS.get(command, {})
+        return list(options)
+    if command is None:
+        return list(COMMANDS)
+    slots = POSITIONALS.get(command, ())
+    slot = slots[len(positionals)] if len(positionals) < len(slots) else None
+    if slot == "project":
+        return snapshot.project_names(managed_only=False)
+    if slot == "managed-project":
+        return snapshot.project_names(managed_only=True)
+    if slot == "managed-branch":
+        return snapshot.branches(project, "managed")
+    return []
+
+
+def complete(words: list[str], snapshot_path: str, cwd: str) -> list[str]:
+    current = words[-1] if words else ""
+    snapshot = Snapshot(load_snapshot(snapshot_path), cwd)
+    found = candidates(words, snapshot)
+    return [item for item in dict.fromkeys(found) if item.startswith(current)]
+
+
+def main(argv: list[str] | None = None) -> int:
+    words = sys.argv[1:] if argv is None else argv
+    for candidate in complete(words, default_snapshot_path(), os.path.realpath(os.getcwd())):
+        print(candidate)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())